@@ -1,39 +1,37 @@
 # Gerekli modülleri import ediyoruz
+import sys                        # Toplu çıktı yazımı için
 from axel.lexer import Lexer      # Lexical analysis (sözcüksel analiz) için
 from axel.parser import Parser    # Syntax analysis (sözdizimsel analiz) için
+from axel.tokens import TOKEN_NAMES  # Token adları (çıktı biçimi için)
 from gui import launch_gui  # Eğer ImportError alırsan, sys.path ile yolu ekleyebiliriz
 
 # Assembly kaynak dosyasını okuyoruz
-with open('./etc/healthkit.asm') as f:
-    source = f.read()  # Dosya içeriğini string olarak alıyoruz
+with open('./etc/healthkit.asm', 'rb') as f:
+    source = f.read()  # Dosya içeriğini ham byte olarak alıyoruz (lexer ASCII çözer)
     
     # ADIM 1: LEXICAL ANALYSIS (Sözcüksel Analiz)
-    # Assembly kodunu token'lara (sözcüklere) ayırıyoruz
+    # Assembly kodunu token'lara (sözcüklere) ayıracak lexer'ı oluşturuyoruz
     test = Lexer(source)
     
-    # Tüm token'ları işliyoruz (lexer iterator olarak çalışıyor)
-    for token in test:
-        pass  # Şimdilik token'ları sadece işliyoruz, yazdırmıyoruz
-    
     # ADIM 2: SYNTAX ANALYSIS (Sözdizimsel Analiz)
-    # Lexer'dan elde edilen token'ları ve sembolleri kullanarak parser oluşturuyoruz
-    test2 = Parser(source, test.symbols)
-    
-    # Parser'dan ilk satırı alıyoruz
-    line = test2.line()
+    # Parser aynı lexer'ı kullanıyor; semboller tokenlar okunurken
+    # lexer'ın tablosuna ekleniyor, ayrı bir ön geçişe gerek yok
+    test2 = Parser(source, lexer=test)
     
     # ADIM 3: ASSEMBLY KOMUTLARINI İŞLEME VE ÇIKTI ALMA
-    print('\nInstructions:')  # Komutlar başlığı
-    
-    # Tüm satırları işleyene kadar devam ediyoruz
-    while line:
-        # Eğer satır boolean değilse (yani gerçek bir komut/veri ise)
-        if not isinstance(line, bool):
-            print(line)  # Komut/veriyi yazdırıyoruz
-        
-        # Bir sonraki satırı al
-        line = test2.line()
-    
+    # Satırlar önce listede biriktiriliyor, sonra tek bir write ile yazılıyor
+    out = ['\nInstructions:']  # Komutlar başlığı
+    
+    # Parser komutları dosya sonuna kadar sırayla üretir (değişken
+    # tanımları parser içinde işlenip atlanır)
+    # Token'lar adlarıyla yazılır; çıktı enum taban sınıfının str/repr
+    # biçimine bağlı kalmaz
+    for mnemonic, operands in test2.parse():
+        out.append(TOKEN_NAMES[mnemonic] + ' ' + ', '.join(
+            f"{TOKEN_NAMES[o['token']]} {o['data']!r}" for o in operands))
+    
+    sys.stdout.write('\n'.join(out) + '\n')
+
     # ADIM 4: SEMBOL TABLOSUNU YAZDIRMA
     # Assembly kodunda tanımlanan etiketler, değişkenler vs.
     print('\nSymbols:\n', test2.symbols.table)
@@ -1,49 +1,61 @@
 # Gerekli modülleri import ediyoruz
 from io import BytesIO                              # Binary veri işleme için
 from collections import deque                       # Stack veri yapısı için
-from typing import Deque, Union, Optional           # Type hinting için
-from axel.symbol import Symbol_Table, U_Int8, U_Int16  # Sembol tablosu ve veri tipleri
+from typing import Deque, Union                     # Type hinting için
+from axel.symbol import Symbol_Table                # Sembol tablosu
 from axel.lexer import Lexer                        # Lexical analyzer
 from axel.parser import Parser                      # Syntax analyzer
-from bitarray import bitarray                       # Bit düzeyinde işlemler için
 
 # Stack veri tipi tanımlaması - int veya string değerleri tutabilir
 Stack_T = Deque[Union[int, str]]
 
+# Status register bit maskeleri (SR tek bir int içinde paketlenir)
+FLAG_C = 1    # Carry: Taşma flag'i
+FLAG_Z = 2    # Zero: Sonuç sıfır flag'i
+FLAG_S = 4    # Sign: İşaret flag'i (negatif/pozitif)
+FLAG_O = 8    # Overflow: Aritmetik taşma flag'i
+FLAG_I = 16   # Interrupt Mask: Kesme maskesi
+FLAG_AC = 32  # Auxiliary Carry: Yardımcı taşma flag'i
+
 class Registers:
     """
     6800 Mikroişlemcisinin register'larını temsil eden sınıf
     Her register, gerçek donanımdaki karşılığını simüle eder
+
+    Register'lar örnek (instance) başına tutulur; iki `Registers`
+    nesnesi aynı status register'ı veya stack'i paylaşmaz.
     """
-    
-    # 8-bit Accumulator A register'ı - Aritmetik işlemler için ana register
-    AccA: U_Int8 = U_Int8(0)
-    
-    # 8-bit Accumulator B register'ı - İkincil accumulator
-    AccB: U_Int8 = U_Int8(0)
-    
-    # 16-bit Index register - Dizi indeksleme ve adres hesaplamaları için
-    X: U_Int16 = U_Int16(0)
-    
-    # 16-bit Stack Pointer - Stack'in tepesini gösterir
-    SP: U_Int16 = U_Int16(0)
-    
-    # 16-bit Program Counter - Çalıştırılacak sonraki komutun adresini tutar
-    PC: U_Int16 = U_Int16(0)
-    
-    # Status Register - İşlemci durumunu gösteren flag'ler
-    # 6 bit'lik bitarray: [C, Z, S, O, I, AC]
-    # C  - Carry: Taşma flag'i
-    # Z  - Zero: Sonuç sıfır flag'i  
-    # S  - Sign: İşaret flag'i (negatif/pozitif)
-    # O  - Overflow: Aritmetik taşma flag'i
-    # I  - Interrupt Mask: Kesme maskesi (henüz implement edilmemiş)
-    # AC - Auxiliary Carry: Yardımcı taşma flag'i
-    SR: bitarray = bitarray([False] * 6)
-    
-    # Stack veri yapısı - LIFO (Last In, First Out) prensibiyle çalışır
-    # Fonksiyon çağrıları, geçici değerler için kullanılır
-    _stack: Stack_T = deque()
+
+    __slots__ = ('AccA', 'AccB', 'X', 'SP', 'PC', 'SR', '_stack')
+
+    def __init__(self) -> None:
+        # 8-bit Accumulator A register'ı - Aritmetik işlemler için ana register
+        # Düz int: çeviriciler sonucu maskesiz yazar, `processing` flag'ları
+        # ham sonuçtan hesapladıktan sonra değeri 8 bite indirger
+        self.AccA: int = 0
+
+        # 8-bit Accumulator B register'ı - İkincil accumulator
+        self.AccB: int = 0
+
+        # 16-bit Index register - Dizi indeksleme ve adres hesaplamaları için
+        # (16-bit register'lar da düz int; yazan çeviriciler 0xFFFF ile maskeler)
+        self.X: int = 0
+
+        # 16-bit Stack Pointer - Stack'in tepesini gösterir
+        self.SP: int = 0
+
+        # 16-bit Program Counter - Çalıştırılacak sonraki komutun adresini tutar
+        self.PC: int = 0
+
+        # Status Register - İşlemci durumunu gösteren flag'ler
+        # 6 bit'lik int: bit 0'dan itibaren [C, Z, S, O, I, AC]
+        # (bkz. FLAG_C ... FLAG_AC maskeleri)
+        # Set: SR |= FLAG_Z, temizle: SR &= ~FLAG_Z, test: SR & FLAG_Z
+        self.SR: int = 0
+
+        # Stack veri yapısı - LIFO (Last In, First Out) prensibiyle çalışır
+        # Fonksiyon çağrıları, geçici değerler için kullanılır
+        self._stack: Stack_T = deque()
 
 class Assembler:
     """
@@ -57,6 +69,12 @@ class Assembler:
     - Token'ları makine koduna çevirir
     - Sembol referanslarını çözümler
     """
+
+    # Örnek alanları (her iki geçiş de aynı Lexer nesnesini kullanır)
+    lexer: Lexer
+    symbol_table: Symbol_Table
+    parser: Parser
+    program: BytesIO
     
     def __init__(self, source: str) -> None:
         """
@@ -65,20 +83,19 @@ class Assembler:
         Args:
             source: Assembly kaynak kodu (string formatında)
         """
-        # Lexer referansı - başlangıçta None, sonra Lexer objesi olacak
-        self.lexer = Optional[Lexer]
-        
         # Birinci geçiş: Sembol tablosunu oluştur
         # Bu aşamada tüm etiketler, değişkenler ve adresleri belirlenir
-        self.symbol_table: Symbol_Table = self._construct_symbol_table(source)
+        self.symbol_table = self._construct_symbol_table(source)
         
         # İkinci geçiş: Parser'ı başlat
-        # Sembol tablosu ile birlikte syntax analysis yapar
-        self.parser: Parser = Parser(source, self.symbol_table)
+        # Birinci geçişin lexer'ı geri sarılıp yeniden kullanılır,
+        # Parser ikinci bir Lexer oluşturmaz
+        self.lexer.rewind()
+        self.parser = Parser(source, self.symbol_table, self.lexer)
         
         # Üretilen makine kodunu tutacak binary stream
         # BytesIO, memory'de binary veri tutmak için kullanılır
-        self.program: BytesIO = BytesIO()
+        self.program = BytesIO()
     
     def _construct_symbol_table(self, source: str) -> Symbol_Table:
         """
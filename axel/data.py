@@ -1,12 +1,10 @@
 # flake8: noqa
 
-import types
 from pampy import match, _
-from bitarray import bitarray
-from typing import Deque, Tuple, Union, List, Any, Callable
+from typing import Tuple, Union, List, Any, Callable
 from axel.assembler import Registers as Register_T  # get class type
+from axel.assembler import FLAG_C, FLAG_Z, FLAG_S, FLAG_O
 from axel.tokens import AddressingMode, Token, Register, TokenEnum
-from axel.symbol import U_Int8
 from axel.lexer import yylex_t
 from axel.parser import Parser
 
@@ -38,9 +36,9 @@ Second_Operand_States = set([
 ])
 
 
-def processing(func: types.FunctionType,
+def processing(func: Callable[..., bytes],
                *args: Any,
-               **kwargs: Any) -> Callable[[Any, Any], Any]:
+               **kwargs: Any) -> Callable[..., bytes]:
     """The `Processor` class decorator function.
 
     Pre- and post-processing on opcode `Translate` methods.
@@ -49,50 +47,57 @@ def processing(func: types.FunctionType,
 
     http://teaching.idallen.com/dat2343/10f/notes/040_overflow.txt
     """
+    def set_from_register(word: int) -> int:
+        """Get status register flags.
 
-    def set_from_register(word: U_Int8, status_register: bitarray) -> None:
-        """Set status register flags.
-
-        Takes an accumulator and sets status register based on results.
+        Takes an unmasked accumulator result and returns the status register
+        word based on results.
         """
+        status = 0
         # carry flag
-        if word.raw > 255 or word.raw < 0:
-            status_register[0] = True
+        if word > 255 or word < 0:
+            status |= FLAG_C
         # sign and overflow flag
-        if word.raw < 0:
-            status_register[3] = True
-            status_register[2] = True
+        if word < 0:
+            status |= FLAG_O | FLAG_S
         # zero flag
-        if word.num == 0:
-            status_register[1] = True
+        if word & 255 == 0:
+            status |= FLAG_Z
+        return status
 
-    def set_status(*args: Any, **kwargs: Any) -> bytearray:
+    def set_status(addr_mode: AddressingMode,
+                   operands: List[yylex_t],
+                   registers: Register_T) -> bytes:
         """Determines the accumulator and sets status flags.
 
         Determines accumulator based on the `operands`, and calls `set_from_register`
         based on active accumulator. Then returns the opcode from the instruction.
 
+        Takes the translator arguments positionally, so a call does not pack
+        an args tuple and kwargs dict on every instruction.
         """
-        operands: Deque[yylex_t] = args[1]
-        registers: Register_T = args[2]
-        op: bytearray = func(*args, **kwargs)
+        op: bytes = func(addr_mode, operands, registers)
 
-        registers.SR = bitarray([False] * 6)  # Reset status register
+        registers.SR = 0  # Reset status register
 
-        if len(operands) > 1 and operands[-1]['token'] in Register:
+        if len(operands) > 1:
             head_op = operands[-1]['token']
             if head_op in Register:
                 if head_op == Register.T_B:
-                    set_from_register(registers.AccB, registers.SR)
+                    registers.SR = set_from_register(registers.AccB)
                 else:
-                    set_from_register(registers.AccA, registers.SR)
+                    registers.SR = set_from_register(registers.AccA)
+
+        # Normalize the accumulators to 8 bits once, after the flags are read
+        registers.AccA &= 255
+        registers.AccB &= 255
         return op
 
     return set_status
 
 
 def get_addressing_mode(parser: Parser,
-                        operands: Deque[yylex_t]) -> AddressingMode:
+                        operands: List[yylex_t]) -> AddressingMode:
     """Get addressing mode via instruction and operands.
 
     Get addressing mode by running the operands through the parser combinator
@@ -104,7 +109,7 @@ def get_addressing_mode(parser: Parser,
 
 
 def operand_state_machine(parser: Parser,
-                           operands: Deque[yylex_t],
+                           operands: List[yylex_t],
                            mode_stack: List[AddressingMode]) -> AddressingMode:
     """Get addressing mode and validate instruction operands
 
@@ -113,7 +118,7 @@ def operand_state_machine(parser: Parser,
 
     Builds a stack of addressing modes by running on each n operand.
     The final instruction addressing mode is thus determined by the n_0 operand
-    since the operand `deque` is provided in reverse order.
+    since the operand list is provided in reverse order.
 
     By running for each operand recursively for `n-1` we validate order
     of operands state sets and their respective type and addressing modes
@@ -156,7 +161,7 @@ def operand_state_machine(parser: Parser,
         if not isinstance(mode, AddressingMode):
             parser.error(mode[1], mode[2])
         else:
-            operands.popleft()
+            del operands[0]
             mode_stack.append(mode)
 
         return operand_state_machine(parser, operands, mode_stack)
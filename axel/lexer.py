@@ -1,14 +1,62 @@
 
-import re
 from axel.tokens import TokenEnum, Token as Token, Register, Mnemonic
-from axel.tokens import Branch_Mnemonics
+from axel.tokens import BRANCH_LO, BRANCH_HI
 from axel.symbol import Symbol_Table, U_Int16
-from collections import deque
-from typing import Optional, TypeVar, Deque, Tuple
+from functools import lru_cache
+import re
+from sys import intern
+from typing import Optional, TypeVar, Tuple, Dict, Callable, Union
 from mypy_extensions import TypedDict
 
 M = TypeVar('M', bound='Lexer')
 
+# Kaynak kod metin ya da ham (ASCII) byte dizisi olarak verilebilir
+Source_T = Union[str, bytes]
+
+# Alt tokenizer imzası: terimi alır, token veya None döndürür
+Handler_T = Callable[[str], Optional[TokenEnum]]
+
+# Karakter tarama desenleri: karakter sınıfları `re` modülünde 256 bitlik
+# tablolara derlenir, böylece karakter başına Python döngüsü çalışmaz
+_TERM = re.compile(r'[^,\t\r\n ]*')            # Terim: virgül, tab, satır sonu, boşluk hariç
+_BLANK = re.compile(r'(?:[ \t]+|;[^\n\r]*)*')  # Boşluklar ve satır sonuna kadar yorumlar
+_EOL_TERMS = ('\n', '\r\n', '\r')            # `_read_term`'ün döndürdüğü satır sonu terimleri
+_HEX_DIGITS = re.compile(r'(?:[0-9A-Fa-f]{2}){1,2}')  # 2 veya 4 hex rakamı
+
+# Metin -> token tabloları ('T_' öneki olmadan), modül yüklenirken bir kez kurulur
+_MNEMONIC_BY_TEXT: Dict[str, TokenEnum] = {m.name[2:]: m for m in Mnemonic}
+_REGISTER_BY_TEXT: Dict[str, TokenEnum] = {r.name[2:]: r for r in Register}
+
+
+@lru_cache(maxsize=4096)
+def _classify_address(term: str) -> Optional[TokenEnum]:
+    """'#$' veya '$' ile başlayan sayısal operandları sınıflandırır.
+
+    Sonuç yalnızca terime bağlıdır (lexer durumuna bağlı değildir), bu
+    yüzden önbelleğe alınır; programda tekrar eden operandlar tek bir
+    sözlük aramasına indirgenir.
+
+    Args:
+        term: Kontrol edilecek terim
+
+    Returns:
+        T_IMM_UINT8, T_IMM_UINT16, T_DIR_ADDR_UINT8, T_EXT_ADDR_UINT16 veya None
+    """
+    if term[:2] == '#$':
+        hex_part = term[2:]
+        short, wide = Token.T_IMM_UINT8, Token.T_IMM_UINT16
+    elif term[:1] == '$':
+        hex_part = term[1:]
+        short, wide = Token.T_DIR_ADDR_UINT8, Token.T_EXT_ADDR_UINT16
+    else:
+        return None
+
+    # Uzunluk ve hex karakter kontrolü tek desen eşleşmesinde (karakter
+    # sınıfı C seviyesinde tabloya derlenir, karakter başına Python döngüsü yok)
+    if _HEX_DIGITS.fullmatch(hex_part) is None:
+        return None
+    return short if len(hex_part) == 2 else wide
+
 
 class yylex_t(TypedDict, total=False):
     """Lexer'ın döndürdüğü veri yapısı. 
@@ -40,13 +88,58 @@ class Lexer:
         for token in lexer:
             print(token)
     """
-    
-    def __init__(self, source: str) -> None:
+
+    # Her token'da okunan alanlar: örnek sözlüğü yerine sabit slotlar
+    __slots__ = ('_source', '_pointer', 'yylex', '_at', '_symbol_table',
+                 '_pending_label', '_pending_variable', '_last',
+                 '_dispatch', '_default_handlers')
+
+    def __init__(self, source: Source_T) -> None:
         """Lexer'ı kaynak kod ile başlatır.
         
+        Tarama durumu `reset` ile kurulur; alt tokenizer tabloları yalnızca
+        burada, nesne başına bir kez oluşturulur.
+
         Args:
-            source: Çözümlenecek assembly kaynak kodu
+            source: Çözümlenecek assembly kaynak kodu (str veya bytes)
+
+        Raises:
+            UnicodeDecodeError: Byte kaynağı ASCII değilse
+        """
+        self.reset(source)
+
+        # İlk karaktere göre çağrılacak alt tokenizer'lar (sırası önemlidir)
+        self._dispatch: Dict[str, Tuple[Handler_T, ...]] = {
+            '\n': (self._eol_token,),
+            '\r': (self._eol_token,),
+            '=': (self._equal_token,),
+            '#': (self._displacement_token, self._immediate_token),
+            '$': (self._displacement_token, self._direct_or_extended_token),
+        }
+        self._default_handlers: Tuple[Handler_T, ...] = (
+            self._register_token,                     # A, B, X
+            self._mnemonic_token,                     # LDA, STA, ADD
+            self._displacement_token,                 # Branch adresleri
+            self._label_token,                        # LOOP:, START
+            self._variable_token)                     # VALUE =
+
+    def reset(self, source: Source_T) -> None:
+        """Lexer'ı yeni bir kaynak için baştan başlatır.
+
+        Tarama durumu ve sembol tablosu sıfırlanır; alt tokenizer tabloları
+        (`_dispatch`, `_default_handlers`) korunur. Böylece aynı Lexer nesnesi
+        birden fazla kaynak için yeniden kullanılabilir. Byte dizisi
+        verilirse tek seferde ASCII olarak çözülür; tarama sırasında karakter
+        başına dönüşüm yapılmaz.
+
+        Args:
+            source: Çözümlenecek assembly kaynak kodu (str veya bytes)
+
+        Raises:
+            UnicodeDecodeError: Byte kaynağı ASCII değilse
         """
+        if isinstance(source, bytes):
+            source = source.decode('ascii')
         self._source: str = source                    # Assembly kaynak kodu
         self._pointer: int = 0                        # Şu anki karakter pozisyonu
         self.yylex: yylex_t = {                      # Son bulunan token bilgisi
@@ -55,7 +148,8 @@ class Lexer:
         }
         self._at = self._pointer                      # Son token öncesi pozisyon
         self._symbol_table: Symbol_Table = Symbol_Table()  # Label ve değişken tablosu
-        self._symbol_stack: Deque[Tuple[str, str]] = deque()  # Geçici sembol yığını
+        self._pending_label: Optional[str] = None     # Mnemoniği bekleyen label
+        self._pending_variable: Optional[str] = None  # '=' bekleyen değişken
         self._last: TokenEnum = Token.T_UNKNOWN      # En son bulunan token türü
 
     @property
@@ -127,29 +221,30 @@ class Lexer:
 
         # Eğer token tanınmadıysa, sembol tablosunda ara
         if token == Token.T_UNKNOWN:
-            if term in self._symbol_table.table:
-                symbol = self._symbol_table.get(term)
-                if symbol is not None:
-                    # Değişken ise, değerini tekrar tokenize et
-                    if symbol[1] == 'variable' and isinstance(symbol[2], str):
-                        token = self._get_token(symbol[2])
+            # Tek sözlük aramasıyla sembolü al
+            symbol = self._symbol_table.table.get(term)
+            if symbol is not None and symbol.type == 'variable':
+                # Değişken ise, değerini tekrar tokenize et
+                value = symbol.value
+                if isinstance(value, bytes):
+                    # Parser tarafından çözümlenmiş değer: '$' metnine geri çevir
+                    value = '$' + value.hex().upper()
+                if isinstance(value, str):
+                    token = self._get_token(value)
 
         return token
 
     def _get_token(self, term: str) -> TokenEnum:
         """Bir terimi uygun token türüne dönüştürür.
 
-        Bu metod sırayla farklı token türlerini kontrol eder:
-        1. Satır sonu (EOL)
-        2. Register'lar (A, B, X)
-        3. Mnemonik'ler (LDA, STA, ADD, vb.)
-        4. Dallanma adresleri (branch displacement)
-        5. Bellek adresleri (direct/extended)
-        6. Virgül ayırıcıları
-        7. Eşitlik işareti
-        8. Immediate değerler (#$FF)
-        9. Label'lar
-        10. Değişkenler
+        Terimin ilk karakterine göre yalnızca eşleşebilecek alt
+        tokenizer'lar denenir (bkz. `_dispatch`):
+        - '\n', '\r'  : Satır sonu (EOL)
+        - ','         : Virgül ayırıcıları (metod çağrısı olmadan, doğrudan)
+        - '='         : Eşitlik işareti
+        - '#'         : Immediate değerler (#$FF), branch sonrası displacement
+        - '$'         : Bellek adresleri (direct/extended), branch sonrası displacement
+        - diğerleri   : Register, mnemonik, displacement, label, değişken
 
         Args:
             term: Çözümlenecek terim
@@ -157,21 +252,18 @@ class Lexer:
         Returns:
             Uygun token türü veya T_UNKNOWN
         """
-        token: Optional[TokenEnum] = None
+        # En sık görülen tek karakterlik token için hızlı yol
+        if term == ',':
+            self._set_token(Token.T_COMMA, term)
+            return Token.T_COMMA
 
-        token = token or self._eol_token(term)                    # \n, \r\n
-        token = token or self._register_token(term)               # A, B, X
-        token = token or self._mnemonic_token(term)               # LDA, STA, ADD
-        token = token or self._displacement_token(term)           # Branch adresleri
-        token = token or self._direct_or_extended_token(term)     # $FF, $FFFF
-        token = token or self._comma_token(term)                  # ,
-        token = token or self._equal_token(term)                  # =
-        token = token or self._immediate_token(term)              # #$FF
-        token = token or self._equal_token(term)                  # = (tekrar kontrol)
-        token = token or self._label_token(term)                  # LOOP:, START
-        token = token or self._variable_token(term)               # VALUE =
+        # İlk eşleşen alt tokenizer'da hemen dön
+        for handler in self._dispatch.get(term[:1], self._default_handlers):
+            token = handler(term)
+            if token:
+                return token
 
-        return token or Token.T_UNKNOWN
+        return Token.T_UNKNOWN
 
     def retract(self) -> None:
         """Pointer'ı son token öncesi pozisyona geri alır.
@@ -182,42 +274,53 @@ class Lexer:
         """
         self._pointer = self._at
 
-    def _inc(self) -> None:
-        """Pointer'ı bir karakter ileri alır (pointer arithmetic benzeri)."""
-        self._pointer += 1
+    def rewind(self) -> None:
+        """Lexer'ı kaynağın başına geri sarar.
 
-    def _dec(self) -> None:
-        """Pointer'ı bir karakter geri alır (pointer arithmetic benzeri)."""
-        self._pointer -= 1
+        Sembol tablosu korunur; böylece birinci geçişte toplanan
+        semboller ikinci geçişte aynı lexer ile kullanılabilir.
+        """
+        self._pointer = 0
+        self._at = 0
+        self._last = Token.T_UNKNOWN
+        self._pending_label = None
+        self._pending_variable = None
+        self._reset()
 
     def _read_term(self) -> str:
         """Kaynak koddan bir sonraki terimi okur.
 
         Bu metod:
         1. Boşlukları ve yorumları atlar
-        2. Özel karakterleri (virgül, satır sonu) tekil olarak döndürür
+        2. Özel karakterleri (virgül, satır sonu) tekil olarak döndürür ve
+           pointer'ı bunların ötesine taşır
         3. Normal terimleri boşluk/virgül/satır sonuna kadar okur
         
         Returns:
             Okunan terim string'i
         """
-        term: str = ''
         self._skip_whitespace_and_comments()          # Boşluk ve yorumları atla
-        
-        # Özel karakterler
-        if self.pointer == '\r':
-            self._inc()
-            return '\r\n'
-        elif self.pointer == '\n':
-            return '\n'
-        elif self.pointer == ',':
-            return ','
-            
-        # Normal terim okuma (delimiter'a kadar)
-        while self.pointer and not re.match('[,\t\n ]', self.pointer):
-            term += self.pointer
-            self._inc()
-        return term
+        source = self._source
+        start = self._pointer
+        size = len(source)
+        char = source[start] if start < size else ''
+
+        # Özel karakterler: pointer burada tek seferde ilerletilir
+        if char == '\r':
+            if source[start + 1:start + 2] == '\n':  # Windows format
+                self._pointer = start + 2
+                return '\r\n'
+            self._pointer = start + 1
+            return '\r'
+        elif char == '\n' or char == ',':
+            self._pointer = start + 1
+            return char
+
+        # Normal terim okuma: delimiter'a kadar tara, sonra tek seferde dilimle
+        match = _TERM.match(source, start)
+        index = match.end() if match is not None else start
+        self._pointer = index
+        return source[start:index]
 
     def _peek_next(self) -> str:
         """Bir sonraki terimi pointer'ı hareket ettirmeden gözetler.
@@ -229,17 +332,15 @@ class Lexer:
         Returns:
             Bir sonraki terim (pointer değişmez)
         """
-        term: str = ''
         self._skip_whitespace_and_comments()
-        index: int = self._pointer
-        size: int = len(self._source)
-        
-        # Geçici pointer ile sonraki terimi oku
-        while index < size and not re.match('[,\t\r\n ]', self._source[index]):
-            term += self._source[index]
-            index += 1
+        source = self._source
+        start: int = self._pointer
 
-        return term
+        # Geçici pointer ile sonraki terimin sonunu bul, tek seferde dilimle
+        match = _TERM.match(source, start)
+        index: int = match.end() if match is not None else start
+
+        return source[start:index]
 
     def _reset(self) -> None:
         """Scanner verilerini sıfırlar."""
@@ -257,40 +358,24 @@ class Lexer:
         }
 
     def _skip_whitespace_and_comments(self) -> None:
-        """Boşlukları ve yorumları özyinelemeli olarak atlar.
+        """Boşlukları ve yorumları tek bir desen eşleşmesinde atlar.
         
         Assembly'de yorumlar ';' ile başlar ve satır sonuna kadar devam eder.
         Bu metod tüm boşlukları (tab, space) ve yorum satırlarını
-        bir sonraki anlamlı karaktere kadar atlar.
-        """
-        # Boşluk karakterlerini atla
-        if re.match('[\t ]', self.pointer):
-            self._inc()
-            self._skip_whitespace_and_comments()
-            
-        # Yorum satırını atla (';' ile başlayan)
-        if self.pointer == ';':
-            self._skip_to_next_line()
-            self._skip_whitespace_and_comments()
-
-    def _skip_to_next_line(self) -> None:
-        """Satır sonu karakterlerine kadar tüm karakterleri atlar.
-        
-        Yorum satırlarını atlamak için kullanılır.
+        bir sonraki anlamlı karaktere kadar atlar. Tarama `_BLANK`
+        deseniyle C seviyesinde yapılır; özyineleme ya da karakter başına
+        Python döngüsü yoktur.
         """
-        skip = True
-        while skip:
-            if not self.pointer:                     # Dosya sonu
-                skip = False
-                break
-            self._inc()
-            if self.pointer == '\n' or self.pointer == '\r':
-                skip = False
+        # Boşluk ve yorum ardışıklarını tek bir desen eşleşmesiyle geç
+        match = _BLANK.match(self._source, self._pointer)
+        if match is not None:
+            self._pointer = match.end()
 
     def _eol_token(self, term: str) -> Optional[TokenEnum]:
         """Satır sonu (End of Line) token'larını tanır.
         
-        Windows (\r\n) ve Unix (\n) formatlarını destekler.
+        Windows (\r\n) ve Unix (\n) formatlarını destekler. Pointer
+        `_read_term` tarafından zaten satır sonunun ötesine taşınmıştır.
         
         Args:
             term: Kontrol edilecek terim
@@ -298,14 +383,8 @@ class Lexer:
         Returns:
             T_EOL token'ı veya None
         """
-        if term[:2] == '\r\n':                       # Windows format
-            self._inc()
-            self._inc()
-            self._set_token(Token.T_EOL, '\r\n')
-            return Token.T_EOL
-        elif term[0] == '\n':                        # Unix format
-            self._inc()
-            self._set_token(Token.T_EOL, '\n')
+        if term in _EOL_TERMS:
+            self._set_token(Token.T_EOL, term)
             return Token.T_EOL
         return None
 
@@ -315,7 +394,7 @@ class Lexer:
         Assembly'de değişkenler şu formatta tanımlanır:
         VARIABLE_NAME = $FF
         
-        Bu metod değişken adını tanır ve sembol yığınına ekler.
+        Bu metod değişken adını tanır ve '=' gelene kadar bekletir.
         
         Args:
             term: Kontrol edilecek terim
@@ -325,29 +404,13 @@ class Lexer:
         """
         # Sonraki terim '=' ise bu bir değişken tanımı
         if self._peek_next() == '=':
-            self._symbol_stack.append(('variable', term))
+            # Sembol adları intern edilir: tablo aramaları kimlik karşılaştırmasıyla biter
+            term = intern(term)
+            self._pending_variable = term
             self._set_token(Token.T_VARIABLE, term)
             return Token.T_VARIABLE
         return None
 
-    def _comma_token(self, term: str) -> Optional[TokenEnum]:
-        """Virgül ayırıcılarını tokenize eder.
-        
-        6800 assembly'de register'lar arası ayırma için kullanılır:
-        LDA A,X  (A register'ından X index register'ı ile)
-        
-        Args:
-            term: Kontrol edilecek terim
-            
-        Returns:
-            T_COMMA token'ı veya None
-        """
-        if self.pointer == ',':
-            self._inc()
-            self._set_token(Token.T_COMMA, term)
-            return Token.T_COMMA
-        return None
-
     def _label_token(self, term: str) -> Optional[TokenEnum]:
         """Label'ları (etiketleri) tokenize eder.
         
@@ -372,8 +435,9 @@ class Lexer:
         
         if previous_line == '\n' or peek_back <= 0:
             # Sonraki terim mnemonik mi veya ':' ile mi bitiyor?
-            if f'T_{self._peek_next()}' in Mnemonic.__members__ or term[-1:] == ':':
-                self._symbol_stack.append(('label', term))
+            if self._peek_next() in _MNEMONIC_BY_TEXT or term[-1:] == ':':
+                term = intern(term)  # Sembol tablosu anahtarı (bkz. `_variable_token`)
+                self._pending_label = term
                 self._set_token(Token.T_LABEL, term)
                 return Token.T_LABEL
         return None
@@ -384,7 +448,7 @@ class Lexer:
         Değişken tanımlarında kullanılır:
         VALUE = $FF
         
-        Bu metod aynı zamanda sembol yığınından değişken adını alır
+        Bu metod aynı zamanda bekleyen değişken adını alır
         ve sembol tablosuna ekler.
         
         Args:
@@ -394,12 +458,13 @@ class Lexer:
             T_EQUAL token'ı veya None
         """
         if term == '=':
-            # Sembol yığınından değişken adını al ve sembol tablosuna ekle
-            if len(self._symbol_stack) and self._symbol_stack[-1][0] == 'variable':
-                assign = self._symbol_stack.pop()
+            # Bekleyen değişken adını al ve sembol tablosuna ekle
+            name = self._pending_variable
+            if name is not None:
+                self._pending_variable = None
                 self._symbol_table.set(
-                    assign[1],                        # Değişken adı
-                    U_Int16(self.last_addr - len(assign[1]) - 1),  # Pozisyon
+                    name,                             # Değişken adı
+                    U_Int16(self.last_addr - len(name) - 1),  # Pozisyon
                     'variable',                       # Tür
                     self._peek_next())               # Değer
 
@@ -424,19 +489,11 @@ class Lexer:
         Returns:
             T_IMM_UINT8, T_IMM_UINT16 veya None
         """
-        if term[:1] == '#' and term[1:2] == '$':
-            try:
-                hex_part = term[2:]
-                byte_len = len(bytes.fromhex(hex_part))
-                
-                if byte_len == 1:                    # 8-bit immediate
-                    self._set_token(Token.T_IMM_UINT8, term)
-                    return Token.T_IMM_UINT8
-                elif byte_len == 2:                  # 16-bit immediate
-                    self._set_token(Token.T_IMM_UINT16, term)
-                    return Token.T_IMM_UINT16
-            except ValueError:
-                pass  # Geçersiz hex değeri
+        if term[:1] == '#':
+            token = _classify_address(term)
+            if token is not None:
+                self._set_token(token, term)
+            return token
         return None
 
     def _direct_or_extended_token(self, term: str) -> Optional[TokenEnum]:
@@ -462,18 +519,10 @@ class Lexer:
             T_DIR_ADDR_UINT8, T_EXT_ADDR_UINT16 veya None
         """
         if term[:1] == '$':
-            try:
-                hex_part = term[1:]
-                byte_len = len(bytes.fromhex(hex_part))
-                
-                if byte_len == 1:                    # 8-bit direct address
-                    self._set_token(Token.T_DIR_ADDR_UINT8, term)
-                    return Token.T_DIR_ADDR_UINT8
-                elif byte_len == 2:                  # 16-bit extended address
-                    self._set_token(Token.T_EXT_ADDR_UINT16, term)
-                    return Token.T_EXT_ADDR_UINT16
-            except ValueError:
-                pass  # Geçersiz hex değeri
+            token = _classify_address(term)
+            if token is not None:
+                self._set_token(token, term)
+            return token
         return None
 
     def _displacement_token(self, term: str) -> Optional[TokenEnum]:
@@ -496,9 +545,11 @@ class Lexer:
             T_DISP_ADDR_INT8 veya None
         """
         # Son token branch mnemonik'i mi?
-        if self._last in Branch_Mnemonics:
+        if BRANCH_LO <= self._last <= BRANCH_HI:
             # Register adı değil ve değişken tanımı değil
-            if f'T_{term[3:]}' not in Register.__members__ and self._peek_next() != '=':
+            if term[3:] not in _REGISTER_BY_TEXT and self._peek_next() != '=':
+                # Hedef etiket adı; tablodaki intern edilmiş anahtarla eşleşir
+                term = intern(term)
                 self._set_token(Token.T_DISP_ADDR_INT8, term)
                 return Token.T_DISP_ADDR_INT8
         return None
@@ -530,38 +581,41 @@ class Lexer:
         Returns:
             Uygun mnemonik token'ı veya None
         """
+        mnemonic = _MNEMONIC_BY_TEXT.get(term[:3])
+        if mnemonic is None:
+            return None
+
         # 3 harfli mnemonik kontrol et
-        if len(term) == 3 and f'T_{term[:3]}' in Mnemonic.__members__:
-            self._set_token(Mnemonic[f'T_{term[:3]}'], term[:3])
+        if len(term) == 3:
+            self._set_token(mnemonic, term[:3])
             
             # Eğer bekleyen label varsa sembol tablosuna ekle
-            if len(self._symbol_stack) and self._symbol_stack[-1][0] == 'label':
-                assign = self._symbol_stack.pop()
+            name = self._pending_label
+            if name is not None:
+                self._pending_label = None
                 self._symbol_table.set(
-                    assign[1],                        # Label adı
-                    U_Int16(self.last_addr - len(assign[1]) - 1),  # Pozisyon
+                    name,                             # Label adı
+                    U_Int16(self.last_addr - len(name) - 1),  # Pozisyon
                     'label',                          # Tür
-                    U_Int16(self.last_addr - len(assign[1]) - 1))  # Değer
-            return Mnemonic[f'T_{term[:3]}']
+                    U_Int16(self.last_addr - len(name) - 1))  # Değer
+            return mnemonic
 
         # 4 harfli mnemonik+register kombinasyonu (örn: LDAA)
-        if (len(term) == 4 and 
-            f'T_{term[:3]}' in Mnemonic.__members__ and 
-            f'T_{term[3:]}' in Register.__members__):
-            
-            self._dec()  # Register karakterini geri al
-            self._set_token(Mnemonic[f'T_{term[:3]}'], term[:3])
+        if len(term) == 4 and term[3:] in _REGISTER_BY_TEXT:
+            self._pointer -= 1  # Register karakterini geri al
+            self._set_token(mnemonic, term[:3])
             
             # Label varsa sembol tablosuna ekle
-            if len(self._symbol_stack) and self._symbol_stack[-1][0] == 'label':
-                assign = self._symbol_stack.pop()
+            name = self._pending_label
+            if name is not None:
+                self._pending_label = None
                 self._symbol_table.set(
-                    assign[1],
-                    U_Int16(self.last_addr - len(assign[1]) - 1),
+                    name,
+                    U_Int16(self.last_addr - len(name) - 1),
                     'label',
-                    U_Int16(self.last_addr - len(assign[1]) - 1))
+                    U_Int16(self.last_addr - len(name) - 1))
 
-            return Mnemonic[f'T_{term[:3]}']
+            return mnemonic
         return None
 
     def _register_token(self, term: str) -> Optional[TokenEnum]:
@@ -584,14 +638,14 @@ class Lexer:
         # X register özel durumu (sonraki karakter kontrol edilir)
         try:
             if self._source[self._pointer + 1] == 'X':
-                self._inc()
+                self._pointer += 1  # 'X' karakterini atla
                 self._set_token(Register.T_X, 'X')
                 return Register.T_X
         except IndexError:
             pass
             
         # Normal register kontrol et (A, B)
-        if f'T_{term}' in Register.__members__:
-            self._set_token(Register[f'T_{term}'], term)
-            return Register[f'T_{term}']
-        return None
\ No newline at end of file
+        register = _REGISTER_BY_TEXT.get(term)
+        if register is not None:
+            self._set_token(register, term)
+        return register
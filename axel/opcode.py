@@ -1,14 +1,243 @@
 
 # Gerekli kütüphaneleri içe aktar
-import types  # Python tip sistemi için
-from typing import Deque, Dict, Any  # Tip ipuçları için
-from bitarray import bitarray  # Bit dizileri için (flag işlemleri)
-from axel.tokens import AddressingMode  # Adres belirtme modları
+from functools import partial  # Dallanma komutlarını tek gövdeden türetmek için
+import operator  # Immediate çeviricilerin akümülatör işlemleri
+from typing import List, Dict, Any, Tuple, Callable, ClassVar  # Tip ipuçları için
+from axel.tokens import AddressingMode, Mnemonic  # Adres modları, komut tokenları
 from axel.parser import Parser, AssemblerParserError  # Assembly parser
 from axel.lexer import yylex_t  # Lexical analyzer tipi
 from axel.data import processing  # Veri işleme dekoratörü
 from axel.assembler import Registers as Register_T
-from test.unit.data_test import addr_codes  # Register sınıf tipi
+from axel.assembler import FLAG_C, FLAG_I, FLAG_O  # Status register maskeleri
+
+# Çeviricilerin karşılaştırdığı adresleme modları (modül seviyesinde bağlı,
+# her karşılaştırmada AddressingMode sınıfında öznitelik araması yapılmaz)
+_ACC = AddressingMode.ACC
+_IMM = AddressingMode.IMM
+_DIR = AddressingMode.DIR
+_EXT = AddressingMode.EXT
+_IDX = AddressingMode.IDX
+
+# Tüm komut çeviricilerinin ortak imzası: (mod, operandlar, register'lar) -> opcode
+Translator_T = Callable[[AddressingMode, List[yylex_t], Register_T], bytes]
+
+
+def _accumulator(operands: List[yylex_t]) -> str:
+    """Son operand A değilse B akümülatörü kabul edilir.
+
+    Operandsız satırlarda (örn: INH modda `ADD`) boş string döner; bu anahtar
+    hiçbir opcode tablosunda bulunmadığından çevirici b'' üretir.
+    """
+    return ('A' if operands[-1]['data'] == 'A' else 'B') if operands else ''
+
+
+# Mod (ve akümülatör) -> opcode tabloları; if/elif merdivenleri yerine
+# her komut tek bir sözlük aramasıyla opcode'unu bulur
+_ADC: Dict[Tuple[AddressingMode, str], int] = {
+    (AddressingMode.IMM, 'A'): 0x89,  # ADCA immediate
+    (AddressingMode.IMM, 'B'): 0xC9,  # ADCB immediate
+}
+_ADD: Dict[Tuple[AddressingMode, str], bytes] = {
+    (AddressingMode.IMM, 'A'): b'\x8b',  # ADDA immediate
+    (AddressingMode.IMM, 'B'): b'\xcb',  # ADDB immediate
+    (AddressingMode.DIR, 'A'): b'\x9b',  # ADDA direct
+    (AddressingMode.DIR, 'B'): b'\xdb',  # ADDB direct
+}
+_AND: Dict[Tuple[AddressingMode, str], bytes] = {
+    (AddressingMode.IMM, 'A'): b'\x84',  # ANDA immediate
+    (AddressingMode.IMM, 'B'): b'\xc4',  # ANDB immediate
+}
+_CMP: Dict[Tuple[AddressingMode, str], bytes] = {
+    (AddressingMode.IMM, 'A'): b'\x81',  # CMPA immediate
+    (AddressingMode.IMM, 'B'): b'\xc1',  # CMPB immediate
+}
+_EOR: Dict[Tuple[AddressingMode, str], bytes] = {
+    (AddressingMode.IMM, 'A'): b'\x88',  # EORA immediate
+    (AddressingMode.IMM, 'B'): b'\xc8',  # EORB immediate
+}
+_ORA: Dict[Tuple[AddressingMode, str], bytes] = {
+    (AddressingMode.IMM, 'A'): b'\x8a',  # ORAA immediate
+    (AddressingMode.IMM, 'B'): b'\xca',  # ORAB immediate
+}
+_SBC: Dict[Tuple[AddressingMode, str], bytes] = {
+    (AddressingMode.IMM, 'A'): b'\x82',  # SBCA immediate
+    (AddressingMode.IMM, 'B'): b'\xc2',  # SBCB immediate
+}
+_SUB: Dict[Tuple[AddressingMode, str], bytes] = {
+    (AddressingMode.IMM, 'A'): b'\x80',  # SUBA immediate
+    (AddressingMode.IMM, 'B'): b'\xc0',  # SUBB immediate
+    (AddressingMode.DIR, 'A'): b'\x90',  # SUBA direct
+    (AddressingMode.DIR, 'B'): b'\xd0',  # SUBB direct
+}
+_CPX: Dict[AddressingMode, bytes] = {
+    AddressingMode.IMM: b'\x8c',  # CPX immediate
+    AddressingMode.DIR: b'\x9c',  # CPX direct
+}
+_JMP: Dict[AddressingMode, bytes] = {
+    AddressingMode.EXT: b'\x7e',  # JMP extended
+    AddressingMode.IDX: b'\x6e',  # JMP indexed
+}
+_JSR: Dict[AddressingMode, bytes] = {
+    AddressingMode.EXT: b'\xbd',  # JSR extended
+    AddressingMode.IDX: b'\xad',  # JSR indexed
+}
+_LDA: Dict[AddressingMode, bytes] = {
+    AddressingMode.IMM: b'\x86',  # LDAA immediate
+    AddressingMode.DIR: b'\x96',  # LDAA direct
+    AddressingMode.EXT: b'\xb6',  # LDAA extended
+}
+_LDB: Dict[AddressingMode, bytes] = {
+    AddressingMode.IMM: b'\xc6',  # LDAB immediate
+    AddressingMode.DIR: b'\xd6',  # LDAB direct
+    AddressingMode.EXT: b'\xf6',  # LDAB extended
+}
+_LDS: Dict[AddressingMode, bytes] = {
+    AddressingMode.IMM: b'\x8e',  # LDS immediate
+    AddressingMode.DIR: b'\x9e',  # LDS direct
+}
+_LDX: Dict[AddressingMode, bytes] = {
+    AddressingMode.IMM: b'\xce',  # LDX immediate
+    AddressingMode.DIR: b'\xde',  # LDX direct
+}
+_STA: Dict[AddressingMode, bytes] = {
+    AddressingMode.DIR: b'\x97',  # STAA direct
+    AddressingMode.EXT: b'\xb7',  # STAA extended
+    AddressingMode.IDX: b'\xa7',  # STAA indexed
+}
+_STB: Dict[AddressingMode, bytes] = {
+    AddressingMode.DIR: b'\xd7',  # STAB direct
+    AddressingMode.EXT: b'\xf7',  # STAB extended
+    AddressingMode.IDX: b'\xe7',  # STAB indexed
+}
+_STS: Dict[AddressingMode, bytes] = {
+    AddressingMode.DIR: b'\x9f',  # STS direct
+    AddressingMode.EXT: b'\xbf',  # STS extended
+}
+_STX: Dict[AddressingMode, bytes] = {
+    AddressingMode.DIR: b'\xdf',  # STX direct
+    AddressingMode.EXT: b'\xff',  # STX extended
+}
+
+
+def _inherent(opcode: bytes,
+              addr_mode: AddressingMode,
+              operands: List[yylex_t],
+              registers: Register_T) -> bytes:
+    """Register'lara dokunmayan inherent komutlar için ortak çevirici.
+
+    Bu komutlar tek bir opcode byte'ından ibarettir; simülasyonda yan
+    etkileri olmadığından yalnızca opcode döndürülür.
+    """
+    return opcode
+
+
+def _by_mode(table: Dict[AddressingMode, bytes],
+             addr_mode: AddressingMode,
+             operands: List[yylex_t],
+             registers: Register_T) -> bytes:
+    """Opcode'u yalnızca adresleme moduna bağlı komutlar için ortak çevirici.
+
+    Register'lara dokunmayan bu komutlar (örn: STX, JMP) opcode'u tek bir
+    mod -> opcode tablosu aramasıyla bulur; desteklenmeyen modda boş döner.
+    """
+    return table.get(addr_mode, b'')
+
+
+def _branch(opcode: int,
+            addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+    """Bcc - Ortak dallanma çevirici.
+
+    Tüm dallanma komutları opcode ve 8-bit offset'ten oluşur; komutlar
+    arasında yalnızca opcode değişir.
+    """
+    # Operand varsa hex'den ('$' öneki atılarak) int'e çevir, yoksa 0
+    data = operands[0]['data'] if operands else None
+    offset = int(data.lstrip('$'), 16) if data else 0
+    # Opcode ve offset'i birleştir
+    return bytes((opcode, offset))
+
+
+def _immediate(opcode: int,
+               accumulate: Callable[[int, int], int],
+               register: str,
+               carry: bool = False) -> Translator_T:
+    """Tek bir akümülatöre sabitlenmiş immediate mod çeviricisi üretir.
+
+    Opcode, hedef akümülatör ve işlem üretim anında bağlanır; böylece
+    çağrı başına operandlardan A/B seçimi yapılmaz. `carry` verilirse
+    operanda carry flag'ı eklenir ve sonuç opcode'un ardından yazılır (ADC).
+    """
+    code = bytes((opcode,))
+
+    def translate(addr_mode: AddressingMode,
+                  operands: List[yylex_t],
+                  registers: Register_T) -> bytes:
+        data = operands[0]['data']
+        if data is None:
+            raise AssemblerParserError('Invalid instruction operand')
+        operand = Parser.parse_immediate_value_int(data)
+        if carry:
+            operand = (operand + (registers.SR & FLAG_C)) & 0xFF
+        if register == 'A':
+            registers.AccA = accumulate(registers.AccA, operand)
+        else:
+            registers.AccB = accumulate(registers.AccB, operand)
+        return bytes((opcode, operand)) if carry else code
+
+    return translate
+
+
+# Kaydırma/döndürme çekirdekleri: (akümülatör, SR) -> (yeni akümülatör, yeni SR)
+def _shl(value: int, status: int) -> Tuple[int, int]:
+    """ASL: 1 bit sola kaydır (çarpma x2)."""
+    return value << 1, status
+
+
+def _shr(value: int, status: int) -> Tuple[int, int]:
+    """ASR/LSR: 1 bit sağa kaydır (bölme /2)."""
+    return value >> 1, status
+
+
+def _rol(value: int, status: int) -> Tuple[int, int]:
+    """ROL: carry ile birlikte sola döndür; en üst bit yeni carry olur."""
+    carry = (value & 0x80) >> 7
+    return (((value << 1) | (status & FLAG_C)) & 0xFF,
+            (status & ~FLAG_C) | carry)
+
+
+def _ror(value: int, status: int) -> Tuple[int, int]:
+    """ROR: carry ile birlikte sağa döndür; en alt bit yeni carry olur."""
+    carry = value & 0x01
+    return ((value >> 1) | ((status & FLAG_C) << 7),
+            (status & ~FLAG_C) | carry)
+
+
+def _shift(opcode_a: int,
+           opcode_b: int,
+           shift: Callable[[int, int], Tuple[int, int]]) -> Translator_T:
+    """Akümülatör modundaki kaydırma/döndürme komutu çeviricisi üretir.
+
+    ASL/ASR/LSR/ROL/ROR yalnızca opcode'ları ve `shift` çekirdeğiyle
+    ayrılır; A/B seçimi ve register güncellemesi tek gövdede yapılır.
+    Akümülatör dışındaki modlarda boş döner.
+    """
+    code_a = bytes((opcode_a,))
+    code_b = bytes((opcode_b,))
+
+    def translate(addr_mode: AddressingMode,
+                  operands: List[yylex_t],
+                  registers: Register_T) -> bytes:
+        if addr_mode != _ACC:
+            return b''
+        if operands[0]['data'] == 'A':
+            registers.AccA, registers.SR = shift(registers.AccA, registers.SR)
+            return code_a
+        registers.AccB, registers.SR = shift(registers.AccB, registers.SR)
+        return code_b
+
+    return translate
 
 
 class Processor(type):
@@ -27,1034 +256,619 @@ class Processor(type):
     """
     def __new__(cls, name: str, bases: Any, attr: Dict[Any, Any]) -> Any:
         """Yeni sınıf oluştururken her method'u processing ile dekore et."""
-        # Sınıfın tüm attribute'larını dolaş
-        for attr_name, value in attr.items():
-            # Eğer değer bir fonksiyon ise ve string değilse
-            if (not isinstance(value, types.FunctionType) and 
-                not isinstance(value, str)):
-                # Processing dekoratörü ile sar
-                attr[attr_name] = processing(value.__func__)
+        # Mnemonic -> çevirici sözlüğü; 'and_' gibi isimler 'and' anahtarıyla
+        dispatch: Dict[str, Translator_T] = {}
+        # Yalnızca staticmethod'ları dolaş (dunder ve string alanlar atlanır)
+        for attr_name, value in list(attr.items()):
+            if isinstance(value, staticmethod):
+                # Processing dekoratörü ile bir kez sar, descriptor olarak bırak
+                wrapped = processing(value.__func__)
+                attr[attr_name] = staticmethod(wrapped)
+                dispatch[attr_name.rstrip('_')] = wrapped
+        attr['DISPATCH'] = dispatch
         
         # Süper sınıfın __new__ metodunu çağır ve yeni sınıfı döndür
         return super(Processor, cls).__new__(cls, name, bases, attr)
 
 
 class Translate(metaclass=Processor):
-    """6800 Assembly Komutlarını Makine Koduna Çeviren Sınıf"""
+    """6800 Assembly Komutlarını Makine Koduna Çeviren Sınıf
+
+    Çeviriciler mnemonic adıyla `Translate.DISPATCH[mnemonic](...)` üzerinden
+    tek bir sözlük aramasıyla çağrılmalıdır (getattr yerine).
+    """
+
+    # Processor metaklası tarafından sınıf oluşturulurken doldurulur
+    DISPATCH: ClassVar[Dict[str, Translator_T]]
+    # Sınıf tanımından sonra DISPATCH'ten türetilir (parser'ın mnemonic tokenı)
+    MNEMONICS: ClassVar[Dict[Mnemonic, Translator_T]]
+
+    @classmethod
+    def emit(cls,
+             mnemonic: str,
+             addr_mode: AddressingMode,
+             operands: List[yylex_t],
+             registers: Register_T) -> bytes:
+        """Mnemonic adıyla çeviriciyi bulup çalıştıran tek giriş noktası.
+
+        Örnek: Translate.emit('sta', AddressingMode.DIR, operands, registers)
+        """
+        return cls.DISPATCH[mnemonic](addr_mode, operands, registers)
+
+    @classmethod
+    def emit_mnemonic(cls,
+                      mnemonic: Mnemonic,
+                      addr_mode: AddressingMode,
+                      operands: List[yylex_t],
+                      registers: Register_T) -> bytes:
+        """`emit` gibi, ancak parser'ın ürettiği mnemonic tokenıyla çağrılır.
+
+        Tokendan isim türetilmez; çevirici tek bir sözlük aramasıyla bulunur.
+        Örnek: Translate.emit_mnemonic(Mnemonic.T_STA, AddressingMode.DIR, ...)
+        """
+        return cls.MNEMONICS[mnemonic](addr_mode, operands, registers)
 
     @staticmethod
     def aba(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """ABA - Add Accumulator B to Accumulator A"""
         # ABA komutu için opcode: 0x1B
-        opcode = bytearray.fromhex('1B')
+        opcode = b'\x1b'
         
         # Eğer accumulator modunda ise
-        if addr_mode == AddressingMode.ACC:
+        if addr_mode == _ACC:
             # A = A + B işlemi yap
-            registers.AccA += registers.AccB.num
+            registers.AccA += registers.AccB
             
         return opcode
 
     @staticmethod
     def adc(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """ADC - Add with Carry"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
         data: int = 0  # Veri değişkeni
-        status: bitarray = registers.SR  # Status register'ı al
+        status: int = registers.SR  # Status register'ı al
         
-        # İlk operandı al
+        # İlk operandı ve hedef akümülatörü bir kez al
         o = operands[0]['data']
+        register = _accumulator(operands)
         # Operand string olmalı, değilse hata fırlat
         if not isinstance(o, str):
             raise AssemblerParserError(f'Invalid instruction operand')
         
-        # Immediate (anlık) mod kontrolü
-        if addr_mode == AddressingMode.IMM:
-            # A register'ına mı yoksa B'ye mi ekleniyor kontrol et
-            if operands[-1]['data'] == 'A':
-                opcode = bytearray.fromhex('89')  # ADCA immediate opcode
-            else:
-                opcode = bytearray.fromhex('C9')  # ADCB immediate opcode
-            
-            # Immediate değeri parse et ve hex'e çevir
-            operand = int(Parser.parse_immediate_value(o).hex(), 16)
-            
-            # Carry flag set edilmiş mi kontrol et
-            if status[0] is True:
-                # Carry varsa binary'e çevir ve carry bit'ini ekle
-                b = bin(operand)
-                data = int('0b' + status.to01()[0] + b[2:], 2)
-            else:
-                # Carry yoksa direkt binary'e çevir
-                data = int(bin(operand), 2)
-            
-            # A register'ına veriyi ekle
+        # (mod, register) -> opcode tablosundan tek aramada bul
+        opcode = _ADC.get((addr_mode, register))
+        if opcode is None:
+            return b''
+
+        # Carry flag'ı en düşük bite eklenir: M + C (8-bit)
+        data = (Parser.parse_immediate_value_int(o) + (status & FLAG_C)) & 0xFF
+
+        # Seçili register'a veriyi ekle
+        if register == 'A':
             registers.AccA += data
-        
-        # Opcode ve veriyi birleştirerek döndür
-        return opcode + bytearray.fromhex(hex(data)[2:])
+        else:
+            registers.AccB += data
+
+        # Opcode ve veriyi tek bir bytes nesnesi olarak döndür
+        # (ayrı nesneleri birleştirmek iki ara tahsis demektir)
+        return bytes((opcode, data))
 
     @staticmethod
     def add(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """ADD - Add without carry"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
-        
-        # Immediate (anlık) mod kontrolü
-        if addr_mode == AddressingMode.IMM:
-            # A register'ına mı ekleniyor kontrol et
-            if operands[-1]['data'] == 'A':
-                opcode = bytearray.fromhex('8B')  # ADDA immediate opcode
-                # Immediate değeri parse et ve A'ya ekle
-                operand = int(Parser.parse_immediate_value(operands[0]['data']).hex(), 16)
+        # (mod, register) -> opcode tablosundan tek aramada bul
+        register = _accumulator(operands)
+        opcode = _ADD.get((addr_mode, register), b'')
+
+        # Immediate modda değeri parse et ve ilgili register'a ekle
+        if addr_mode == _IMM:
+            data = operands[0]['data']
+            if data is None:
+                raise AssemblerParserError('Invalid instruction operand')
+            operand = Parser.parse_immediate_value_int(data)
+            if register == 'A':
                 registers.AccA += operand
             else:
-                opcode = bytearray.fromhex('CB')  # ADDB immediate opcode
-                # Immediate değeri parse et ve B'ye ekle
-                operand = int(Parser.parse_immediate_value(operands[0]['data']).hex(), 16)
                 registers.AccB += operand
-        # Direct (doğrudan) mod kontrolü
-        elif addr_mode == AddressingMode.DIR:
-            # A register'ına mı ekleniyor kontrol et
-            if operands[-1]['data'] == 'A':
-                opcode = bytearray.fromhex('9B')  # ADDA direct opcode
-            else:
-                opcode = bytearray.fromhex('DB')  # ADDB direct opcode
-        
+
         return opcode
 
     @staticmethod
     def and_(addr_mode: AddressingMode,
-             operands: Deque[yylex_t],
-             registers: Register_T) -> bytearray:
+             operands: List[yylex_t],
+             registers: Register_T) -> bytes:
         """AND - Logical AND"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
-        
-        # Immediate (anlık) mod kontrolü
-        if addr_mode == AddressingMode.IMM:
-            # A register'ıyla mı AND yapılıyor kontrol et
-            if operands[-1]['data'] == 'A':
-                opcode = bytearray.fromhex('84')  # ANDA immediate opcode
-                # Immediate değeri parse et ve A ile AND yap
-                operand = int(Parser.parse_immediate_value(operands[0]['data']).hex(), 16)
+        # (mod, register) -> opcode tablosundan tek aramada bul
+        register = _accumulator(operands)
+        opcode = _AND.get((addr_mode, register), b'')
+
+        # Immediate modda değeri parse et ve ilgili register ile AND yap
+        if addr_mode == _IMM:
+            data = operands[0]['data']
+            if data is None:
+                raise AssemblerParserError('Invalid instruction operand')
+            operand = Parser.parse_immediate_value_int(data)
+            if register == 'A':
                 registers.AccA &= operand
             else:
-                opcode = bytearray.fromhex('C4')  # ANDB immediate opcode
-                # Immediate değeri parse et ve B ile AND yap
-                operand = int(Parser.parse_immediate_value(operands[0]['data']).hex(), 16)
                 registers.AccB &= operand
-        
-        return opcode
-
-    @staticmethod
-    def asl(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """ASL - Arithmetic Shift Left"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
-        
-        # Accumulator mod kontrolü
-        if addr_mode == AddressingMode.ACC:
-            # A register'ını mı shift ediyoruz kontrol et
-            if operands[0]['data'] == 'A':
-                opcode = bytearray.fromhex('48')  # ASLA opcode
-                # A register'ını 1 bit sola kaydır (çarpma x2)
-                registers.AccA <<= 1
-            else:
-                opcode = bytearray.fromhex('58')  # ASLB opcode
-                # B register'ını 1 bit sola kaydır (çarpma x2)
-                registers.AccB <<= 1
-        
-        return opcode
 
-    @staticmethod
-    def asr(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """ASR - Arithmetic Shift Right"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
-        
-        # Accumulator mod kontrolü
-        if addr_mode == AddressingMode.ACC:
-            # A register'ını mı shift ediyoruz kontrol et
-            if operands[0]['data'] == 'A':
-                opcode = bytearray.fromhex('47')  # ASRA opcode
-                # A register'ını 1 bit sağa kaydır (bölme /2)
-                registers.AccA >>= 1
-            else:
-                opcode = bytearray.fromhex('57')  # ASRB opcode  
-                # B register'ını 1 bit sağa kaydır (bölme /2)
-                registers.AccB >>= 1
-        
         return opcode
 
-    @staticmethod
-    def bcc(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BCC - Branch if Carry Clear"""
-        opcode = bytearray.fromhex('24')  # BCC opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bcs(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BCS - Branch if Carry Set"""
-        opcode = bytearray.fromhex('25')  # BCS opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def beq(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BEQ - Branch if Equal"""
-        opcode = bytearray.fromhex('27')  # BEQ opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bge(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BGE - Branch if Greater or Equal"""
-        opcode = bytearray.fromhex('2C')  # BGE opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bgt(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BGT - Branch if Greater Than"""
-        opcode = bytearray.fromhex('2E')  # BGT opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bhi(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BHI - Branch if Higher"""
-        opcode = bytearray.fromhex('22')  # BHI opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def ble(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BLE - Branch if Less or Equal"""
-        opcode = bytearray.fromhex('2F')  # BLE opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bls(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BLS - Branch if Lower or Same"""
-        opcode = bytearray.fromhex('23')  # BLS opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def blt(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BLT - Branch if Less Than"""
-        opcode = bytearray.fromhex('2D')  # BLT opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bmi(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BMI - Branch if Minus"""
-        opcode = bytearray.fromhex('2B')  # BMI opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bne(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BNE - Branch if Not Equal"""
-        opcode = bytearray.fromhex('26')  # BNE opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bpl(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BPL - Branch if Plus"""
-        opcode = bytearray.fromhex('2A')  # BPL opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bra(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BRA - Branch Always"""
-        opcode = bytearray.fromhex('20')  # BRA opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bsr(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BSR - Branch to Subroutine"""
-        opcode = bytearray.fromhex('8D')  # BSR opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bvc(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BVC - Branch if Overflow Clear"""
-        opcode = bytearray.fromhex('28')  # BVC opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def bvs(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """BVS - Branch if Overflow Set"""
-        opcode = bytearray.fromhex('29')  # BVS opcode
-        # Operand varsa hex'den int'e çevir, yoksa 0
-        offset = int(operands[0]['data'], 16) if operands else 0
-        # Opcode ve offset'i birleştir
-        return opcode + bytearray([offset])
-
-    @staticmethod
-    def cba(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """CBA - Compare Accumulators"""
-        opcode = bytearray.fromhex('11')  # CBA opcode
-        # A - B karşılaştırması yapar, sonuç flag'larda saklanır
-        # Gerçek çıkarma yapılmaz, sadece flag'lar güncellenir
-        return opcode
+    asl = staticmethod(_shift(0x48, 0x58, _shl))  # ASL - Arithmetic Shift Left
+    asr = staticmethod(_shift(0x47, 0x57, _shr))  # ASR - Arithmetic Shift Right
+
+    # Dallanma (relative) komutları: hepsi aynı gövdeyi paylaşır, yalnızca
+    # opcode farklıdır (bkz. `_branch`)
+    bcc = staticmethod(partial(_branch, 0x24))  # BCC - Branch if Carry Clear
+    bcs = staticmethod(partial(_branch, 0x25))  # BCS - Branch if Carry Set
+    beq = staticmethod(partial(_branch, 0x27))  # BEQ - Branch if Equal
+    bge = staticmethod(partial(_branch, 0x2C))  # BGE - Branch if Greater or Equal
+    bgt = staticmethod(partial(_branch, 0x2E))  # BGT - Branch if Greater Than
+    bhi = staticmethod(partial(_branch, 0x22))  # BHI - Branch if Higher
+    ble = staticmethod(partial(_branch, 0x2F))  # BLE - Branch if Less or Equal
+    bls = staticmethod(partial(_branch, 0x23))  # BLS - Branch if Lower or Same
+    blt = staticmethod(partial(_branch, 0x2D))  # BLT - Branch if Less Than
+    bmi = staticmethod(partial(_branch, 0x2B))  # BMI - Branch if Minus
+    bne = staticmethod(partial(_branch, 0x26))  # BNE - Branch if Not Equal
+    bpl = staticmethod(partial(_branch, 0x2A))  # BPL - Branch if Plus
+    bra = staticmethod(partial(_branch, 0x20))  # BRA - Branch Always
+    bsr = staticmethod(partial(_branch, 0x8D))  # BSR - Branch to Subroutine
+    bvc = staticmethod(partial(_branch, 0x28))  # BVC - Branch if Overflow Clear
+    bvs = staticmethod(partial(_branch, 0x29))  # BVS - Branch if Overflow Set
+
+    # Yan etkisiz inherent komutlar - hepsi ortak _inherent gövdesinden
+    cba = staticmethod(partial(_inherent, b'\x11'))  # CBA - Compare Accumulators
+    daa = staticmethod(partial(_inherent, b'\x19'))  # DAA - Decimal Adjust Accumulator
+    nop = staticmethod(partial(_inherent, b'\x01'))  # NOP - No Operation
+    rti = staticmethod(partial(_inherent, b'\x3b'))  # RTI - Return from Interrupt
+    rts = staticmethod(partial(_inherent, b'\x39'))  # RTS - Return from Subroutine
+    swi = staticmethod(partial(_inherent, b'\x3f'))  # SWI - Software Interrupt
+    wai = staticmethod(partial(_inherent, b'\x3e'))  # WAI - Wait for Interrupt
+
+    # Opcode'u yalnızca adresleme moduna bağlı komutlar - ortak _by_mode gövdesi
+    cpx = staticmethod(partial(_by_mode, _CPX))  # CPX - Compare Index Register
+    jmp = staticmethod(partial(_by_mode, _JMP))  # JMP - Jump
+    jsr = staticmethod(partial(_by_mode, _JSR))  # JSR - Jump to Subroutine
+    lds = staticmethod(partial(_by_mode, _LDS))  # LDS - Load Stack Pointer
+    ldx = staticmethod(partial(_by_mode, _LDX))  # LDX - Load Index Register
+    sta = staticmethod(partial(_by_mode, _STA))  # STA - Store Accumulator A
+    stb = staticmethod(partial(_by_mode, _STB))  # STB - Store Accumulator B
+    sts = staticmethod(partial(_by_mode, _STS))  # STS - Store Stack Pointer
+    stx = staticmethod(partial(_by_mode, _STX))  # STX - Store Index Register
+
+    # Akümülatörü sabitlenmiş immediate mod çeviricileri (örn: ADDB #$10);
+    # aynı komutun genel çeviricisiyle aynı sonucu verir
+    adca_imm = staticmethod(_immediate(0x89, operator.add, 'A', carry=True))  # ADCA #
+    adcb_imm = staticmethod(_immediate(0xC9, operator.add, 'B', carry=True))  # ADCB #
+    adda_imm = staticmethod(_immediate(0x8B, operator.add, 'A'))  # ADDA #
+    addb_imm = staticmethod(_immediate(0xCB, operator.add, 'B'))  # ADDB #
+    anda_imm = staticmethod(_immediate(0x84, operator.and_, 'A'))  # ANDA #
+    andb_imm = staticmethod(_immediate(0xC4, operator.and_, 'B'))  # ANDB #
+    eora_imm = staticmethod(partial(_inherent, b'\x88'))  # EORA #
+    eorb_imm = staticmethod(partial(_inherent, b'\xc8'))  # EORB #
+    oraa_imm = staticmethod(partial(_inherent, b'\x8a'))  # ORAA #
+    orab_imm = staticmethod(partial(_inherent, b'\xca'))  # ORAB #
 
     @staticmethod
     def clc(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """CLC - Clear Carry"""
-        opcode = bytearray.fromhex('0C')  # CLC opcode
-        registers.SR[0] = False  # Carry flag'ını temizle (bit 0)
+        opcode = b'\x0c'  # CLC opcode
+        registers.SR &= ~FLAG_C  # Carry flag'ını temizle (bit 0)
         return opcode
 
     @staticmethod
     def cli(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """CLI - Clear Interrupt Mask"""
-        opcode = bytearray.fromhex('0E')  # CLI opcode
-        registers.SR[4] = False  # Interrupt mask flag'ını temizle (bit 4)
+        opcode = b'\x0e'  # CLI opcode
+        registers.SR &= ~FLAG_I  # Interrupt mask flag'ını temizle (bit 4)
         return opcode
 
     @staticmethod
     def clr(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """CLR - Clear"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
+        opcode: bytes = b''  # Boş opcode başlat
         
         # Accumulator mod kontrolü
-        if addr_mode == AddressingMode.ACC:
+        if addr_mode == _ACC:
             # A register'ını mı temizliyoruz kontrol et
             if operands[0]['data'] == 'A':
-                opcode = bytearray.fromhex('4F')  # CLRA opcode
+                opcode = b'\x4f'  # CLRA opcode
                 registers.AccA = 0  # A register'ını sıfırla
             else:
-                opcode = bytearray.fromhex('5F')  # CLRB opcode
+                opcode = b'\x5f'  # CLRB opcode
                 registers.AccB = 0  # B register'ını sıfırla
         
         return opcode
 
     @staticmethod
     def clv(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """CLV - Clear Overflow"""
-        opcode = bytearray.fromhex('0A')  # CLV opcode
-        registers.SR[1] = False  # Overflow flag'ını temizle (bit 1)
+        opcode = b'\x0a'  # CLV opcode
+        registers.SR &= ~FLAG_O  # Overflow flag'ını temizle (bit 3)
         return opcode
 
     @staticmethod
     def cmp(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """CMP - Compare"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
-        
-        # Immediate (anlık) mod kontrolü
-        if addr_mode == AddressingMode.IMM:
-            # A register'ıyla mı karşılaştırıyoruz kontrol et
-            if operands[-1]['data'] == 'A':
-                opcode = bytearray.fromhex('81')  # CMPA immediate opcode
-            else:
-                opcode = bytearray.fromhex('C1')  # CMPB immediate opcode
-        
+        # (mod, register) -> opcode tablosundan tek aramada bul
+        opcode: bytes = _CMP.get((addr_mode, _accumulator(operands)), b'')
+
         return opcode
 
     @staticmethod
     def com(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """COM - Complement"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
+        opcode: bytes = b''  # Boş opcode başlat
         
         # Accumulator mod kontrolü
-        if addr_mode == AddressingMode.ACC:
+        if addr_mode == _ACC:
             # A register'ının mı complement'ini alıyoruz kontrol et
             if operands[0]['data'] == 'A':
-                opcode = bytearray.fromhex('43')  # COMA opcode
+                opcode = b'\x43'  # COMA opcode
                 # A register'ının tüm bitlerini ters çevir (1'ler complement)
                 registers.AccA = ~registers.AccA & 0xFF
             else:
-                opcode = bytearray.fromhex('53')  # COMB opcode
+                opcode = b'\x53'  # COMB opcode
                 # B register'ının tüm bitlerini ters çevir (1'ler complement)
                 registers.AccB = ~registers.AccB & 0xFF
         
         return opcode
 
-    @staticmethod
-    def cpx(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """CPX - Compare Index Register"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
-        
-        # Immediate (anlık) mod kontrolü
-        if addr_mode == AddressingMode.IMM:
-            opcode = bytearray.fromhex('8C')  # CPX immediate opcode
-        # Direct (doğrudan) mod kontrolü
-        elif addr_mode == AddressingMode.DIR:
-            opcode = bytearray.fromhex('9C')  # CPX direct opcode
-        
-        return opcode
-
-    @staticmethod
-    def daa(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """DAA - Decimal Adjust Accumulator"""
-        opcode = bytearray.fromhex('19')  # DAA opcode
-        # BCD (Binary Coded Decimal) decimal adjust işlemi
-        # BCD aritmetiği sonrası A register'ını düzelt
-        return opcode
-
     @staticmethod
     def dec(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """DEC - Decrement"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
+        opcode: bytes = b''  # Boş opcode başlat
         
         # Accumulator mod kontrolü
-        if addr_mode == AddressingMode.ACC:
+        if addr_mode == _ACC:
             # A register'ını mı azaltıyoruz kontrol et
             if operands[0]['data'] == 'A':
-                opcode = bytearray.fromhex('4A')  # DECA opcode
+                opcode = b'\x4a'  # DECA opcode
                 registers.AccA -= 1  # A register'ını 1 azalt
             else:
-                opcode = bytearray.fromhex('5A')  # DECB opcode
+                opcode = b'\x5a'  # DECB opcode
                 registers.AccB -= 1  # B register'ını 1 azalt
         
         return opcode
 
     @staticmethod
     def des(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """DES - Decrement Stack Pointer"""
-        opcode = bytearray.fromhex('34')  # DES opcode
-        registers.SP -= 1  # Stack Pointer'ını 1 azalt
+        opcode = b'\x34'  # DES opcode
+        registers.SP = (registers.SP - 1) & 0xFFFF  # Stack Pointer'ını 1 azalt
         return opcode
 
     @staticmethod
     def dex(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """DEX - Decrement Index Register"""
-        opcode = bytearray.fromhex('09')  # DEX opcode
-        registers.X -= 1  # Index Register'ını 1 azalt
+        opcode = b'\x09'  # DEX opcode
+        registers.X = (registers.X - 1) & 0xFFFF  # Index Register'ını 1 azalt
         return opcode
 
     @staticmethod
     def eor(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """EOR - Exclusive OR"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
-        
-        # Immediate (anlık) mod kontrolü
-        if addr_mode == AddressingMode.IMM:
-            # A register'ıyla mı XOR yapıyoruz kontrol et
-            if operands[-1]['data'] == 'A':
-                opcode = bytearray.fromhex('88')  # EORA immediate opcode
-            else:
-                opcode = bytearray.fromhex('C8')  # EORB immediate opcode
-        
+        # (mod, register) -> opcode tablosundan tek aramada bul
+        opcode: bytes = _EOR.get((addr_mode, _accumulator(operands)), b'')
+
         return opcode
 
     @staticmethod
     def inc(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """INC - Increment"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
+        opcode: bytes = b''  # Boş opcode başlat
         
         # Accumulator mod kontrolü
-        if addr_mode == AddressingMode.ACC:
+        if addr_mode == _ACC:
             # A register'ını mı artırıyoruz kontrol et
             if operands[0]['data'] == 'A':
-                opcode = bytearray.fromhex('4C')  # INCA opcode
+                opcode = b'\x4c'  # INCA opcode
                 registers.AccA += 1  # A register'ını 1 artır
             else:
-                opcode = bytearray.fromhex('5C')  # INCB opcode
+                opcode = b'\x5c'  # INCB opcode
                 registers.AccB += 1  # B register'ını 1 artır
         
         return opcode
 
     @staticmethod
     def ins(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """INS - Increment Stack Pointer"""
-        opcode = bytearray.fromhex('31')  # INS opcode
-        registers.SP += 1  # Stack Pointer'ını 1 artır
+        opcode = b'\x31'  # INS opcode
+        registers.SP = (registers.SP + 1) & 0xFFFF  # Stack Pointer'ını 1 artır
         return opcode
 
     @staticmethod
     def inx(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
         """INX - Increment Index Register"""
-        opcode = bytearray.fromhex('08')  # INX opcode
-        registers.X += 1  # Index Register'ını 1 artır
-        return opcode
-
-    @staticmethod
-    def jmp(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """JMP - Jump"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
-        
-        # Extended (genişletilmiş) mod kontrolü
-        if addr_mode == AddressingMode.EXT:
-            opcode = bytearray.fromhex('7E')  # JMP extended opcode
-        # Indexed (indeksli) mod kontrolü
-        elif addr_mode == AddressingMode.IND:
-            opcode = bytearray.fromhex('6E')  # JMP indexed opcode
-        
+        opcode = b'\x08'  # INX opcode
+        registers.X = (registers.X + 1) & 0xFFFF  # Index Register'ını 1 artır
         return opcode
 
     @staticmethod
-    def jsr(addr_mode: AddressingMode,
-            operands: Deque[yylex_t],
-            registers: Register_T) -> bytearray:
-        """JSR - Jump to Subroutine"""
-        opcode: bytearray = bytearray()  # Boş opcode başlat
-
-        if addr_mode == AddressingMode.EXT:
-            opcode = bytearray.fromhex('BD')  # JSR extended - Genişletilmiş adresleme ile alt yordam çağırma
-        elif addr_mode == AddressingMode.IND:
-            opcode = bytearray.fromhex('AD')  # JSR indexed - İndeksli adresleme ile alt yordam çağırma
-
-        return opcode
-
-@staticmethod
-def lda(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """LDA - Load Accumulator A - A akümülatörüne veri yükle"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.IMM:
-        opcode = bytearray.fromhex('86')  # LDA immediate - Doğrudan değer ile A'ya yükle
-        operand = int(Parser.parse_immediate_value(operands[0]['data']).hex(), 16)
-        registers.AccA = operand  # A register'ına değeri ata
-    elif addr_mode == AddressingMode.DIR:
-        opcode = bytearray.fromhex('96')  # LDA direct - Doğrudan adresleme ile A'ya yükle
-    elif addr_mode == AddressingMode.EXT:
-        opcode = bytearray.fromhex('B6')  # LDA extended - Genişletilmiş adresleme ile A'ya yükle
-    
-    return opcode
-
-@staticmethod
-def ldb(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """LDB - Load Accumulator B - B akümülatörüne veri yükle"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.IMM:
-        opcode = bytearray.fromhex('C6')  # LDB immediate - Doğrudan değer ile B'ye yükle
-        operand = int(Parser.parse_immediate_value(operands[0]['data']).hex(), 16)
-        registers.AccB = operand  # B register'ına değeri ata
-    elif addr_mode == AddressingMode.DIR:
-        opcode = bytearray.fromhex('D6')  # LDB direct - Doğrudan adresleme ile B'ye yükle
-    elif addr_mode == AddressingMode.EXT:
-        opcode = bytearray.fromhex('F6')  # LDB extended - Genişletilmiş adresleme ile B'ye yükle
-    
-    return opcode
-
-@staticmethod
-def lds(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """LDS - Load Stack Pointer - Stack pointer'a değer yükle"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.IMM:
-        opcode = bytearray.fromhex('8E')  # LDS immediate - Doğrudan değer ile SP'ye yükle
-    elif addr_mode == AddressingMode.DIR:
-        opcode = bytearray.fromhex('9E')  # LDS direct - Doğrudan adresleme ile SP'ye yükle
-    
-    return opcode
-
-@staticmethod
-def ldx(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """LDX - Load Index Register - X index register'ına değer yükle"""
-    opcode: bytearray = bytearray()
+    def lda(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """LDA - Load Accumulator A - A akümülatörüne veri yükle"""
+        opcode: bytes = _LDA.get(addr_mode, b'')
     
-    if addr_mode == AddressingMode.IMM:
-        opcode = bytearray.fromhex('CE')  # LDX immediate - Doğrudan değer ile X'e yükle
-    elif addr_mode == AddressingMode.DIR:
-        opcode = bytearray.fromhex('DE')  # LDX direct - Doğrudan adresleme ile X'e yükle
+        if addr_mode == _IMM:
+            data = operands[0]['data']
+            if data is None:
+                raise AssemblerParserError('Invalid instruction operand')
+            operand = Parser.parse_immediate_value_int(data)
+            registers.AccA = operand  # A register'ına değeri ata
     
-    return opcode
+        return opcode
 
-@staticmethod
-def lsr(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """LSR - Logical Shift Right - Mantıksal sağa kaydırma"""
-    opcode: bytearray = bytearray()
+    @staticmethod
+    def ldb(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """LDB - Load Accumulator B - B akümülatörüne veri yükle"""
+        opcode: bytes = _LDB.get(addr_mode, b'')
     
-    if addr_mode == AddressingMode.ACC:
-        if operands[0]['data'] == 'A':
-            opcode = bytearray.fromhex('44')  # LSRA - A register'ını sağa kaydır
-            registers.AccA >>= 1  # A'yı bir bit sağa kaydır
-        else:
-            opcode = bytearray.fromhex('54')  # LSRB - B register'ını sağa kaydır
-            registers.AccB >>= 1  # B'yi bir bit sağa kaydır
+        if addr_mode == _IMM:
+            data = operands[0]['data']
+            if data is None:
+                raise AssemblerParserError('Invalid instruction operand')
+            operand = Parser.parse_immediate_value_int(data)
+            registers.AccB = operand  # B register'ına değeri ata
     
-    return opcode
+        return opcode
 
-@staticmethod
-def neg(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """NEG - Negate - İki'nin tümleyenini al (negatif değer)"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.ACC:
-        if operands[0]['data'] == 'A':
-            opcode = bytearray.fromhex('40')  # NEGA - A register'ının negatifini al
-            registers.AccA = (-registers.AccA) & 0xFF  # A = -A (8-bit sınırında)
-        else:
-            opcode = bytearray.fromhex('50')  # NEGB - B register'ının negatifini al
-            registers.AccB = (-registers.AccB) & 0xFF  # B = -B (8-bit sınırında)
-    
-    return opcode
+    lsr = staticmethod(_shift(0x44, 0x54, _shr))  # LSR - Logical Shift Right
 
-@staticmethod
-def nop(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """NOP - No Operation - Hiçbir işlem yapma (bekle)"""
-    return bytearray.fromhex('01')  # NOP opcode'u
-
-@staticmethod
-def ora(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """ORA - Inclusive OR - Mantıksal VEYA işlemi"""
-    opcode: bytearray = bytearray()
+    @staticmethod
+    def neg(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """NEG - Negate - İki'nin tümleyenini al (negatif değer)"""
+        opcode: bytes = b''
     
-    if addr_mode == AddressingMode.IMM:
-        if operands[-1]['data'] == 'A':
-            opcode = bytearray.fromhex('8A')  # ORAA immediate - A register'ı ile VEYA
-        else:
-            opcode = bytearray.fromhex('CA')  # ORAB immediate - B register'ı ile VEYA
+        if addr_mode == _ACC:
+            if operands[0]['data'] == 'A':
+                opcode = b'\x40'  # NEGA - A register'ının negatifini al
+                registers.AccA = (-registers.AccA) & 0xFF  # A = -A (8-bit sınırında)
+            else:
+                opcode = b'\x50'  # NEGB - B register'ının negatifini al
+                registers.AccB = (-registers.AccB) & 0xFF  # B = -B (8-bit sınırında)
     
-    return opcode
+        return opcode
 
-@staticmethod
-def psh(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """PSH - Push - Register'ı stack'e pushla"""
-    opcode: bytearray = bytearray()
-    
-    if operands[0]['data'] == 'A':
-        opcode = bytearray.fromhex('36')  # PSHA - A register'ını stack'e pushla
-    else:
-        opcode = bytearray.fromhex('37')  # PSHB - B register'ını stack'e pushla
-    
-    return opcode
+    @staticmethod
+    def ora(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """ORA - Inclusive OR - Mantıksal VEYA işlemi"""
+        # Hedef akümülatör bir kez okunur; opcode (mod, register)
+        # tablosundan tek aramada bulunur
+        register = _accumulator(operands)
+        opcode: bytes = _ORA.get((addr_mode, register), b'')
 
-@staticmethod
-def pul(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """PUL - Pull - Stack'ten register'a veri çek"""
-    opcode: bytearray = bytearray()
-    
-    if operands[0]['data'] == 'A':
-        opcode = bytearray.fromhex('32')  # PULA - Stack'ten A register'ına çek
-    else:
-        opcode = bytearray.fromhex('33')  # PULB - Stack'ten B register'ına çek
-    
-    return opcode
+        return opcode
 
-@staticmethod
-def rol(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """ROL - Rotate Left - Carry flag ile birlikte sola döndür"""
-    opcode: bytearray = bytearray()
+    @staticmethod
+    def psh(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """PSH - Push - Register'ı stack'e pushla"""
+        opcode: bytes = b''
     
-    if addr_mode == AddressingMode.ACC:
         if operands[0]['data'] == 'A':
-            opcode = bytearray.fromhex('49')  # ROLA - A register'ını sola döndür
-            # Carry flag ile birlikte sola kaydırma işlemi
-            carry = (registers.AccA & 0x80) >> 7  # En üst bit = yeni carry
-            registers.AccA = ((registers.AccA << 1) | registers.SR[0]) & 0xFF  # Sola kaydır + eski carry
-            registers.SR[0] = carry  # Yeni carry flag'ını set et
+            opcode = b'\x36'  # PSHA - A register'ını stack'e pushla
         else:
-            opcode = bytearray.fromhex('59')  # ROLB - B register'ını sola döndür
-            carry = (registers.AccB & 0x80) >> 7  # En üst bit = yeni carry
-            registers.AccB = ((registers.AccB << 1) | registers.SR[0]) & 0xFF  # Sola kaydır + eski carry
-            registers.SR[0] = carry  # Yeni carry flag'ını set et
+            opcode = b'\x37'  # PSHB - B register'ını stack'e pushla
     
-    return opcode
+        return opcode
 
-@staticmethod
-def ror(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """ROR - Rotate Right - Carry flag ile birlikte sağa döndür"""
-    opcode: bytearray = bytearray()
+    @staticmethod
+    def pul(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """PUL - Pull - Stack'ten register'a veri çek"""
+        opcode: bytes = b''
     
-    if addr_mode == AddressingMode.ACC:
         if operands[0]['data'] == 'A':
-            opcode = bytearray.fromhex('46')  # RORA - A register'ını sağa döndür
-            # Carry flag ile birlikte sağa kaydırma işlemi
-            carry = registers.AccA & 0x01  # En alt bit = yeni carry
-            registers.AccA = (registers.AccA >> 1) | (registers.SR[0] << 7)  # Sağa kaydır + eski carry
-            registers.SR[0] = carry  # Yeni carry flag'ını set et
+            opcode = b'\x32'  # PULA - Stack'ten A register'ına çek
         else:
-            opcode = bytearray.fromhex('56')  # RORB - B register'ını sağa döndür
-            carry = registers.AccB & 0x01  # En alt bit = yeni carry
-            registers.AccB = (registers.AccB >> 1) | (registers.SR[0] << 7)  # Sağa kaydır + eski carry
-            registers.SR[0] = carry  # Yeni carry flag'ını set et
+            opcode = b'\x33'  # PULB - Stack'ten B register'ına çek
     
-    return opcode
-
-@staticmethod
-def rti(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """RTI - Return from Interrupt - Interrupt'tan dön"""
-    opcode = bytearray.fromhex('3B')
-    # Stack'ten register'ları geri yükle
-    # Sıralama: CCR, B, A, XH, XL, PCH, PCL
-    return opcode
-
-@staticmethod
-def rts(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """RTS - Return from Subroutine - Alt yordamdan dön"""
-    opcode = bytearray.fromhex('39')
-    # Stack'ten return address'i çek ve PC'ye yükle
-    return opcode
-
-@staticmethod
-def sba(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """SBA - Subtract Accumulator B from A - A'dan B'yi çıkar"""
-    opcode = bytearray.fromhex('10')
-    # A = A - B işlemi
-    registers.AccA -= registers.AccB
-    return opcode
-
-@staticmethod
-def sbc(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """SBC - Subtract with Carry - Carry ile birlikte çıkarma"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.IMM:
-        if operands[-1]['data'] == 'A':
-            opcode = bytearray.fromhex('82')  # SBCA immediate - A'dan carry ile çıkar
-        else:
-            opcode = bytearray.fromhex('C2')  # SBCB immediate - B'den carry ile çıkar
-        
-        # A = A - M - C formülü (M: operand, C: carry flag)
-        operand = int(Parser.parse_immediate_value(operands[0]['data']).hex(), 16)
-        if operands[-1]['data'] == 'A':
-            registers.AccA = registers.AccA - operand - registers.SR[0]  # A - operand - carry
-        else:
-            registers.AccB = registers.AccB - operand - registers.SR[0]  # B - operand - carry
-    
-    return opcode
-
-@staticmethod
-def sec(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """SEC - Set Carry - Carry flag'ını set et"""
-    opcode = bytearray.fromhex('0D')
-    registers.SR[0] = True  # Carry flag'ını 1 yap
-    return opcode
+        return opcode
 
-@staticmethod
-def sei(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """SEI - Set Interrupt Mask - Interrupt mask flag'ını set et"""
-    opcode = bytearray.fromhex('0F')
-    registers.SR[4] = True  # Interrupt mask flag'ını 1 yap (interrupt'ları devre dışı bırak)
-    return opcode
+    rol = staticmethod(_shift(0x49, 0x59, _rol))  # ROL - Rotate Left (carry ile)
+    ror = staticmethod(_shift(0x46, 0x56, _ror))  # ROR - Rotate Right (carry ile)
 
-@staticmethod
-def sev(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """SEV - Set Overflow - Overflow flag'ını set et"""
-    opcode = bytearray.fromhex('0B')
-    registers.SR[1] = True  # Overflow flag'ını 1 yap
-    return opcode
+    @staticmethod
+    def sba(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """SBA - Subtract Accumulator B from A - A'dan B'yi çıkar"""
+        opcode = b'\x10'
+        # A = A - B işlemi
+        registers.AccA -= registers.AccB
+        return opcode
 
-@staticmethod
-def sta(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """STA - Store Accumulator A - A register'ının değerini belleğe kaydet"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.DIR:
-        opcode = bytearray.fromhex('97')  # STA direct - Doğrudan adresleme ile kaydet
-    elif addr_mode == AddressingMode.EXT:
-        opcode = bytearray.fromhex('B7')  # STA extended - Genişletilmiş adresleme ile kaydet
-    elif addr_mode == AddressingMode.IND:
-        opcode = bytearray.fromhex('A7')  # STA indexed - İndeksli adresleme ile kaydet
+    @staticmethod
+    def sbc(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """SBC - Subtract with Carry - Carry ile birlikte çıkarma"""
+        # (mod, register) -> opcode tablosundan tek aramada bul
+        register = _accumulator(operands)
+        opcode = _SBC.get((addr_mode, register), b'')
+    
+        if addr_mode == _IMM:
+            # A = A - M - C formülü (M: operand, C: carry flag)
+            data = operands[0]['data']
+            if data is None:
+                raise AssemblerParserError('Invalid instruction operand')
+            operand = Parser.parse_immediate_value_int(data)
+            if register == 'A':
+                registers.AccA = registers.AccA - operand - (registers.SR & FLAG_C)  # A - operand - carry
+            else:
+                registers.AccB = registers.AccB - operand - (registers.SR & FLAG_C)  # B - operand - carry
     
-    return opcode
+        return opcode
 
-@staticmethod
-def stb(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """STB - Store Accumulator B - B register'ının değerini belleğe kaydet"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.DIR:
-        opcode = bytearray.fromhex('D7')  # STB direct - Doğrudan adresleme ile kaydet
-    elif addr_mode == AddressingMode.EXT:
-        opcode = bytearray.fromhex('F7')  # STB extended - Genişletilmiş adresleme ile kaydet
-    elif addr_mode == AddressingMode.IND:
-        opcode = bytearray.fromhex('E7')  # STB indexed - İndeksli adresleme ile kaydet
-    
-    return opcode
+    @staticmethod
+    def sec(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """SEC - Set Carry - Carry flag'ını set et"""
+        opcode = b'\x0d'
+        registers.SR |= FLAG_C  # Carry flag'ını 1 yap
+        return opcode
 
-@staticmethod
-def sts(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """STS - Store Stack Pointer - Stack pointer'ın değerini belleğe kaydet"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.DIR:
-        opcode = bytearray.fromhex('9F')  # STS direct - Doğrudan adresleme ile kaydet
-    elif addr_mode == AddressingMode.EXT:
-        opcode = bytearray.fromhex('BF')  # STS extended - Genişletilmiş adresleme ile kaydet
-    
-    return opcode
+    @staticmethod
+    def sei(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """SEI - Set Interrupt Mask - Interrupt mask flag'ını set et"""
+        opcode = b'\x0f'
+        registers.SR |= FLAG_I  # Interrupt mask flag'ını 1 yap (interrupt'ları devre dışı bırak)
+        return opcode
 
-@staticmethod
-def stx(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """STX - Store Index Register - X register'ının değerini belleğe kaydet"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.DIR:
-        opcode = bytearray.fromhex('DF')  # STX direct - Doğrudan adresleme ile kaydet
-    elif addr_mode == AddressingMode.EXT:
-        opcode = bytearray.fromhex('FF')  # STX extended - Genişletilmiş adresleme ile kaydet
-    
-    return opcode
+    @staticmethod
+    def sev(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """SEV - Set Overflow - Overflow flag'ını set et"""
+        opcode = b'\x0b'
+        registers.SR |= FLAG_O  # Overflow flag'ını 1 yap
+        return opcode
 
-@staticmethod
-def sub(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """SUB - Subtract - Çıkarma işlemi"""
-    opcode: bytearray = bytearray()
-    
-    if addr_mode == AddressingMode.IMM:
-        if operands[-1]['data'] == 'A':
-            opcode = bytearray.fromhex('80')  # SUBA immediate - A'dan doğrudan değer çıkar
-            operand = int(Parser.parse_immediate_value(operands[0]['data']).hex(), 16)
-            registers.AccA -= operand  # A = A - operand
-        else:
-            opcode = bytearray.fromhex('C0')  # SUBB immediate - B'den doğrudan değer çıkar
-            operand = int(Parser.parse_immediate_value(operands[0]['data']).hex(), 16)
-            registers.AccB -= operand  # B = B - operand
-    elif addr_mode == AddressingMode.DIR:
-        if operands[-1]['data'] == 'A':
-            opcode = bytearray.fromhex('90')  # SUBA direct - A'dan bellek değeri çıkar
-        else:
-            opcode = bytearray.fromhex('D0')  # SUBB direct - B'den bellek değeri çıkar
+    @staticmethod
+    def sub(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """SUB - Subtract - Çıkarma işlemi"""
+        # Hedef akümülatör bir kez okunur; opcode (mod, register)
+        # tablosundan tek aramada bulunur
+        register = _accumulator(operands)
+        opcode = _SUB.get((addr_mode, register), b'')
+    
+        if addr_mode == _IMM:
+            data = operands[0]['data']
+            if data is None:
+                raise AssemblerParserError('Invalid instruction operand')
+            operand = Parser.parse_immediate_value_int(data)
+            if register == 'A':
+                registers.AccA -= operand  # A = A - operand
+            else:
+                registers.AccB -= operand  # B = B - operand
     
-    return opcode
-
-@staticmethod
-def swi(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """SWI - Software Interrupt - Yazılım interrupt'ı"""
-    opcode = bytearray.fromhex('3F')
-    # Tüm register'ları stack'e push et ve interrupt vector'a jump et
-    return opcode
+        return opcode
 
-@staticmethod
-def tab(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """TAB - Transfer A to B - A register'ının değerini B'ye kopyala"""
-    opcode = bytearray.fromhex('16')
-    registers.AccB = registers.AccA  # B = A
-    return opcode
+    @staticmethod
+    def tab(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """TAB - Transfer A to B - A register'ının değerini B'ye kopyala"""
+        opcode = b'\x16'
+        registers.AccB = registers.AccA  # B = A
+        return opcode
 
-@staticmethod
-def tap(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """TAP - Transfer A to Condition Codes - A register'ının değerini CCR'ye transfer et"""
-    opcode = bytearray.fromhex('06')
-    # A register'ının her bitini CCR flag'larına aktar
-    for i in range(8):
-        registers.SR[i] = bool((registers.AccA >> i) & 1)
-    return opcode
+    @staticmethod
+    def tap(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """TAP - Transfer A to Condition Codes - A register'ının değerini CCR'ye transfer et"""
+        opcode = b'\x06'
+        # A register'ının alt 6 bitini CCR flag'larına aktar
+        registers.SR = registers.AccA & 0x3F
+        return opcode
 
-@staticmethod
-def tba(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """TBA - Transfer B to A - B register'ının değerini A'ya kopyala"""
-    opcode = bytearray.fromhex('17')
-    registers.AccA = registers.AccB  # A = B
-    return opcode
+    @staticmethod
+    def tba(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """TBA - Transfer B to A - B register'ının değerini A'ya kopyala"""
+        opcode = b'\x17'
+        registers.AccA = registers.AccB  # A = B
+        return opcode
 
-@staticmethod
-def tpa(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """TPA - Transfer Condition Codes to A - CCR flag'larını A register'ına transfer et"""
-    opcode = bytearray.fromhex('07')
-    # CCR'nin değerini A register'ına transfer et
-    registers.AccA = 0
-    for i in range(8):
-        if registers.SR[i]:  # Eğer flag set ise
-            registers.AccA |= (1 << i)  # İlgili biti A'da set et
-    return opcode
+    @staticmethod
+    def tpa(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """TPA - Transfer Condition Codes to A - CCR flag'larını A register'ına transfer et"""
+        opcode = b'\x07'
+        # CCR'nin değerini A register'ına transfer et
+        registers.AccA = registers.SR  # Flag bitleri A'nın alt 6 bitine
+        return opcode
 
-@staticmethod
-def tst(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """TST - Test - Register'ı test et (0 ile karşılaştır)"""
-    opcode: bytearray = bytearray()
+    @staticmethod
+    def tst(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """TST - Test - Register'ı test et (0 ile karşılaştır)"""
+        opcode: bytes = b''
     
-    if addr_mode == AddressingMode.ACC:
-        if operands[0]['data'] == 'A':
-            opcode = bytearray.fromhex('4D')  # TSTA - A register'ını test et
-            # A register'ını test et (A - 0 işlemi, sadece flag'lar etkilenir)
-        else:
-            opcode = bytearray.fromhex('5D')  # TSTB - B register'ını test et
-            # B register'ını test et (B - 0 işlemi, sadece flag'lar etkilenir)
+        if addr_mode == _ACC:
+            if operands[0]['data'] == 'A':
+                opcode = b'\x4d'  # TSTA - A register'ını test et
+                # A register'ını test et (A - 0 işlemi, sadece flag'lar etkilenir)
+            else:
+                opcode = b'\x5d'  # TSTB - B register'ını test et
+                # B register'ını test et (B - 0 işlemi, sadece flag'lar etkilenir)
     
-    return opcode
+        return opcode
 
-@staticmethod
-def tsx(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """TSX - Transfer Stack Pointer to X - Stack pointer'ı X register'ına transfer et"""
-    opcode = bytearray.fromhex('30')
-    registers.X = registers.SP + 1  # X = SP + 1 (MC6800'ün özelliği)
-    return opcode
+    @staticmethod
+    def tsx(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """TSX - Transfer Stack Pointer to X - Stack pointer'ı X register'ına transfer et"""
+        opcode = b'\x30'
+        registers.X = (registers.SP + 1) & 0xFFFF  # X = SP + 1 (MC6800'ün özelliği)
+        return opcode
+
+    @staticmethod
+    def txs(addr_mode: AddressingMode,
+            operands: List[yylex_t],
+            registers: Register_T) -> bytes:
+        """TXS - Transfer X to Stack Pointer - X register'ını stack pointer'a transfer et"""
+        opcode = b'\x35'
+        registers.SP = (registers.X - 1) & 0xFFFF  # SP = X - 1 (MC6800'ün özelliği)
+        return opcode
 
-@staticmethod
-def txs(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """TXS - Transfer X to Stack Pointer - X register'ını stack pointer'a transfer et"""
-    opcode = bytearray.fromhex('35')
-    registers.SP = registers.X - 1  # SP = X - 1 (MC6800'ün özelliği)
-    return opcode
 
-@staticmethod
-def wai(addr_mode: AddressingMode,
-        operands: Deque[yylex_t],
-        registers: Register_T) -> bytearray:
-    """WAI - Wait for Interrupt - Interrupt bekle"""
-    opcode = bytearray.fromhex('3E')
-    # Tüm register'ları stack'e push et ve interrupt gelene kadar bekle
-    return opcode
\ No newline at end of file
+# Mnemonic tokenı -> çevirici tablosu, içe aktarmada bir kez kurulur
+# ('T_AND' -> DISPATCH['and']); çevirisi olmayan mnemonic'ler tabloda yer almaz
+Translate.MNEMONICS = {
+    token: Translate.DISPATCH[token.name[2:].lower()]
+    for token in Mnemonic
+    if token.name[2:].lower() in Translate.DISPATCH
+}
@@ -1,13 +1,64 @@
 # Gerekli modüller, tip tanımları ve sınıf tanımları yapılmış.
 import axel.tokens as Tokens
-from collections import deque
-from typing import Union, List, overload, Deque, Tuple
-from axel.lexer import Lexer, yylex_t
+from functools import lru_cache
+from typing import (Union, List, Optional, overload, Tuple, FrozenSet,
+                    Iterator, Dict, Callable)
+from axel.lexer import Lexer, Source_T, yylex_t
 from axel.symbol import Symbol_Table, U_Int16
 
 # Tip alias'ları: Token türleri ve Instruction (komut) tuple'ı tanımlanmış.
 Token_T = Union[Tokens.Token, Tokens.Mnemonic, Tokens.Register]
-Instruction_T = Tuple[Tokens.TokenEnum, Deque[yylex_t]]
+Instruction_T = Tuple[Tokens.TokenEnum, List[yylex_t]]
+
+# Sık beklenen token kümeleri; modül yüklenirken bir kez kurulur, böylece
+# `take` her çağrıda liste oluşturup doğrusal tarama yapmaz
+_MNEMONIC_TOKENS: FrozenSet[Token_T] = frozenset(Tokens.Mnemonic)
+_VARIABLE_VALUE_TOKENS: FrozenSet[Token_T] = frozenset([
+    Tokens.Token.T_DIR_ADDR_UINT8,
+    Tokens.Token.T_EXT_ADDR_UINT16,
+])
+_OPERAND_TOKENS: FrozenSet[Token_T] = frozenset([
+    *Tokens.Register,
+    Tokens.Token.T_COMMA,
+    Tokens.Token.T_IMM_UINT8,
+    Tokens.Token.T_IMM_UINT16,
+    Tokens.Token.T_DIR_ADDR_UINT8,
+    Tokens.Token.T_EXT_ADDR_UINT16,
+    Tokens.Token.T_DISP_ADDR_INT8,
+])
+
+# `line` döngüsünde sık karşılaştırılan tokenlar; her turda
+# `Tokens.Token.X` öznitelik zinciri çözülmesin diye modül seviyesinde tutulur
+_EOL = Tokens.Token.T_EOL
+_LABEL = Tokens.Token.T_LABEL
+_VARIABLE = Tokens.Token.T_VARIABLE
+_MNEMONIC_CLASS = Tokens.Mnemonic  # `type(x) is` ile MRO taraması yapılmaz
+
+
+@lru_cache(maxsize=512)
+def _parse_immediate_int(value: str) -> int:
+    """'#$1A' / '$1A' biçimindeki hex değeri tamsayıya çevirir.
+
+    Programlar küçük bir sabit kümesini ('#$00', '#$FF', sayaçlar) tekrar
+    tekrar kullandığından sonuç önbelleğe alınır.
+    """
+    if value[:1] == '#' and value[1:2] == '$':
+        return int(value[2:], 16)
+    else:
+        return int(value[1:], 16)
+
+
+@lru_cache(maxsize=512)
+def _parse_immediate_bytes(value: str) -> bytes:
+    """'#$1A' / '$1A' biçimindeki hex değeri bytes'a çevirir.
+
+    `_parse_immediate_int` ile aynı nedenle önbelleğe alınır; bytes
+    değiştirilemez olduğundan aynı nesnenin paylaşılması güvenlidir.
+    """
+    if value[:1] == '#' and value[1:2] == '$':
+        return bytes.fromhex(value[2:])
+    else:
+        return bytes.fromhex(value[1:])
 
 # Özel hata sınıfı: Parser hatalarında kullanılacak.
 class AssemblerParserError(Exception):
@@ -24,11 +75,21 @@ class Parser:
     - Komutları ve operandları parçalar.
     """
 
-    def __init__(self, source: str,
-                 symbols: Symbol_Table = Symbol_Table()) -> None:
+    def __init__(self, source: Source_T,
+                 symbols: Optional[Symbol_Table] = None,
+                 lexer: Optional[Lexer] = None) -> None:
+        """
+        Verilen lexer varsa yeniden kullanılır, yoksa kaynak için yeni bir
+        Lexer oluşturulur. Sembol tablosu verilmezse lexer'ın tablosu
+        kullanılır; böylece sembolleri toplamak için ayrı bir lexer
+        geçişine gerek kalmaz.
+        """
         self._line = 1                   # Satır sayacı
-        self.lexer: Lexer = Lexer(source)  # Kaynak kodu lexing işlemi için Lexer sınıfı
-        self.symbols: Symbol_Table = symbols  # Sembol tablosu (etiketler, değişkenler vs)
+        # Kaynak kodu lexing işlemi için Lexer sınıfı
+        self.lexer: Lexer = lexer if lexer is not None else Lexer(source)
+        # Sembol tablosu (etiketler, değişkenler vs)
+        self.symbols: Symbol_Table = (
+            symbols if symbols is not None else self.lexer.symbols)
 
     # Hata mesajı üretme fonksiyonu
     def error(self, expected: str, found: Tokens.TokenEnum) -> None:
@@ -48,99 +109,157 @@ class Parser:
         """
         Örnek: '#$1A' ya da '#1A' gibi stringleri bytes'a dönüştürür.
         TODO: decimal, binary, karakter gibi formatlar eklenebilir.
+        Sonuçlar modül seviyesindeki `_parse_immediate_bytes` önbelleğinden gelir.
         """
-        if value[:1] == '#' and value[1:2] == '$':
-            return bytes.fromhex(value[2:])
-        else:
-            return bytes.fromhex(value[1:])
+        return _parse_immediate_bytes(value)
+
+    # Immediate değerleri doğrudan tamsayıya çeviren fonksiyon
+    @classmethod
+    def parse_immediate_value_int(cls, value: str) -> int:
+        """
+        `parse_immediate_value` ile aynı formatları kabul eder, ancak
+        bytes -> hex metni -> int dönüşümü yerine hex rakamlarını tek
+        seferde tamsayıya çevirir. Örnek: '#$1A' -> 26.
+        Sonuçlar modül seviyesindeki `_parse_immediate_int` önbelleğinden gelir.
+        """
+        return _parse_immediate_int(value)
 
     # "take" fonksiyonu: Beklenen token tiplerini test eder, bulamazsa hata fırlatır.
     @overload
     def take(self, test: List[Token_T]) -> None: ...
 
+    @overload
+    def take(self, test: FrozenSet[Token_T]) -> None: ...
+
     @overload
     def take(self, test: Token_T) -> None: ...
 
-    def take(self, test: Union[Token_T, List[Token_T]]) -> None:
+    def take(self,
+             test: Union[Token_T, List[Token_T], FrozenSet[Token_T]]) -> None:
         """
         Lexer'dan bir sonraki token alınır.
         Eğer token, beklenenlerden biri değilse lexer geri çekilir ve hata verilir.
+        Sık kullanılan beklenti kümeleri frozenset olarak verilir (O(1) arama).
         """
 
         lexer = self.lexer
         next_token = next(lexer)  # Lexer'dan token al
 
-        if isinstance(test, list):
-            # Eğer beklenenler listesi ise, token listede var mı kontrol et
-            if next_token not in test:
-                options = list(map(lambda x: x.name, test))
-                lexer.retract()  # Token geri çekilir
-                self.error(', '.join(options), next_token)  # Hata mesajı
-        else:
+        if isinstance(test, Tokens.TokenEnum):
             # Tek bir beklenen token varsa, karşılaştır
             if next_token is not test:
                 lexer.retract()
                 self.error(test.name, next_token)
+        elif next_token not in test:
+            # Beklenenler listesi/kümesi: token içinde yoksa hata ver
+            options = [x.name for x in test]
+            if not isinstance(test, list):
+                options.sort()  # Küme sırası sabit değildir, mesaj için sırala
+            lexer.retract()  # Token geri çekilir
+            self.error(', '.join(options), next_token)  # Hata mesajı
+
+    # "try_take": take'in hata fırlatmayan hali, beklenen token yoksa False döner
+    def try_take(self, test: FrozenSet[Token_T]) -> bool:
+        """
+        Lexer'dan bir sonraki token alınır ve kümede olup olmadığı döner.
+        Token beklenenlerden değilse lexer geri çekilir; hata fırlatılmaz.
+        Operand listesinin sonu gibi olağan durumlar için kullanılır.
+        """
+        lexer = self.lexer
+        if next(lexer) in test:
+            return True
+        lexer.retract()  # Token geri çekilir
+        return False
 
     # Kaynak koddan bir satır okuma ve yorumlama fonksiyonu
-    def line(self) -> Union[
-            Tuple[Tokens.TokenEnum, Deque[yylex_t]],
-            bool]:
+    def line(self) -> Optional[Instruction_T]:
         """
         Satırdaki ilk token okunur.
         Boş satırlar atlanır.
         Satırdaki içerik:
             - Etiket varsa, devamında komut beklenir, komut ve operandlar döner.
-            - Değişken tanımı varsa, sembol tablosuna kaydedilir.
+            - Değişken tanımı varsa, sembol tablosuna kaydedilir ve
+              bir sonraki satıra geçilir.
             - Direkt komut varsa, komut ve operandlar döner.
-        Satır sonuna gelince True, False ya da komut tuple'ı döner.
+        Komut tuple'ı, dosya sonunda ise None döner.
         """
 
         lexer = self.lexer
-        # Beklenen token isimleri listesi
-        test = [
-            Tokens.Token.T_LABEL.name,
-            Tokens.Token.T_VARIABLE.name,
-            Tokens.Token.T_MNEMONIC.name]
         try:
-            next(lexer)
-            current = lexer.yylex['token']  # Geçerli token
-
-            # Boş satırları atla (EOL tokenları)
-            while current == Tokens.Token.T_EOL:
-                self._line += 1
-                next(lexer)
-                current = lexer.yylex['token']
-
-            if current == Tokens.Token.T_LABEL:
-                # Etiket bulundu, hemen ardından mnemonic (komut) beklenir
-                self.take(list(Tokens.Mnemonic))
-                line = self.instruction(lexer.yylex)  # Komut ve operandları çöz
-                self.take(Tokens.Token.T_EOL)          # Satır sonu bekle
-                self._line += 1
-                return line  # Komut ve operandlar döner
-
-            elif current == Tokens.Token.T_VARIABLE:
-                # Değişken tanımı
-                self.variable(lexer.yylex)   # Değişkeni işle
-                self.take(Tokens.Token.T_EOL)  # Satır sonu bekle
-                self._line += 1
-                return True  # Değişken tanımlandığını bildir
-
-            elif isinstance(current, Tokens.Mnemonic):
-                # Direkt komut varsa
-                line = self.instruction(lexer.yylex)
-                self.take(Tokens.Token.T_EOL)
-                self._line += 1
-                return line
+            while True:
+                current = next(lexer)  # Geçerli token (__next__ döndürür)
+
+                # Boş satırları atla (EOL tokenları)
+                while current is _EOL:
+                    self._line += 1
+                    current = next(lexer)
+
+                # Etiket ve değişken satırları tablodan tek aramada seçilir
+                handler = _LINE_DISPATCH.get(current)
+                if handler is not None:
+                    line = handler(self)
+                    if line is None:
+                        continue  # Değişken tanımı: sonraki satıra geç
+                    return line  # Komut ve operandlar döner
+
+                if type(current) is _MNEMONIC_CLASS:
+                    # Direkt komut varsa
+                    return self._mnemonic()
+
+                break
 
         except StopIteration:
             # Dosya sonu, işlem bitti
-            return False
+            return None
 
         # Yukarıdaki durumların dışında hata var demektir.
-        self.error(', '.join(test), lexer.yylex['token'])
-        return False
+        self.error(', '.join([
+            _LABEL.name,
+            _VARIABLE.name,
+            Tokens.Token.T_MNEMONIC.name]), current)
+        return None
+
+    # `line` yardımcıları: satırın ilk tokenı okunduktan sonra çağrılır
+    def _variable_line(self) -> None:
+        """Değişken tanımı işlenir; komut üretmediği için None döner."""
+        self.variable(self.lexer.yylex)   # Değişkeni işle
+        self.take(_EOL)  # Satır sonu bekle
+        self._line += 1
+
+    def _label_line(self) -> Instruction_T:
+        """Etiketten hemen sonra mnemonic (komut) beklenir."""
+        self.take(_MNEMONIC_TOKENS)
+        return self._mnemonic()
+
+    def _mnemonic(self) -> Instruction_T:
+        """Komut ve operandları çözülür, ardından satır sonu beklenir."""
+        line = self.instruction(self.lexer.yylex)
+        self.take(_EOL)
+        self._line += 1
+        return line
+
+    # Iterator protokolü: `for instruction, operands in parser: ...`
+    def __iter__(self) -> 'Parser':
+        return self
+
+    def __next__(self) -> Instruction_T:
+        """
+        Bir sonraki komut tuple'ını döner; dosya sonunda StopIteration.
+        Değişken tanımları `line` içinde işlendiğinden yalnızca komutlar gelir.
+        """
+        instruction = self.line()
+        if instruction is None:
+            raise StopIteration
+        return instruction
+
+    # Kaynağın tamamını komut komut üreten fonksiyon
+    def parse(self) -> Iterator[Instruction_T]:
+        """
+        Dosya sonuna kadar komut tuple'larını üretir (parser'ın kendisi).
+        Çağıran taraf satırları ara bir listede biriktirmeden doğrudan
+        çevirebilir.
+        """
+        return self
 
     # Değişken tanımı işleme fonksiyonu
     def variable(self, label: yylex_t) -> None:
@@ -153,58 +272,57 @@ class Parser:
         addr = self.lexer.last_addr  # Adres bilgisi
 
         self.take(Tokens.Token.T_EQUAL)  # '=' bekle
-        self.take([Tokens.Token.T_DIR_ADDR_UINT8,
-                   Tokens.Token.T_EXT_ADDR_UINT16])  # Değişken değeri bekle
+        self.take(_VARIABLE_VALUE_TOKENS)  # Değişken değeri bekle
 
         # Sembol tablosundaki kayıt alınır ve bytes olarak güncellenir.
         if isinstance(name, str) and self.lexer.yylex['data'] is not None:
-            symbol = self.symbols.get(name)
-            if symbol is not None and isinstance(symbol[2], str):
+            symbol = self.symbols.table.get(name)
+            value = symbol.value if symbol is not None else None
+            if isinstance(value, str):
                 self.symbols.set(
                     name,
                     U_Int16(addr),
                     'variable',
-                    Parser.parse_immediate_value(symbol[2]))
+                    Parser.parse_immediate_value(value))
             else:
                 raise AssemblerParserError(
                     f'Parser failed on variable "{name}"')
 
     # Operandları işleyen fonksiyon
-    def operands(self) -> Deque[yylex_t]:
+    def operands(self) -> List[yylex_t]:
         """
         Operatörler, registerlar ve çeşitli veri türleri alınır.
-        Operantlar deque yapısına ters sırada eklenir (yığın gibi).
+        Operantlar listeye ters sırada döner (yığın gibi).
         Hata olursa veya yeni token kalmazsa işlem biter.
         """
-        stack: Deque[yylex_t] = deque()
-
-        # Desteklenen operand türleri
-        datatypes = [
-            Tokens.Token.T_IMM_UINT8,
-            Tokens.Token.T_IMM_UINT16,
-            Tokens.Token.T_DIR_ADDR_UINT8,
-            Tokens.Token.T_EXT_ADDR_UINT16,
-            Tokens.Token.T_DISP_ADDR_INT8,
-        ]
-        while True:
-            try:
-                # Register, virgül veya veri tiplerinden biri beklenir
-                self.take([
-                    *list(Tokens.Register),
-                    Tokens.Token.T_COMMA,
-                    *datatypes])
-                stack.appendleft(self.lexer.yylex)  # En başa ekle
-            except AssemblerParserError:
-                self.lexer.retract()  # Token geri çekilir
-                break
-            except StopIteration:
-                break
+        stack: List[yylex_t] = []
+        append = stack.append
+        try_take = self.try_take
+        lexer = self.lexer
+
+        try:
+            # Register, virgül veya veri tiplerinden biri geldikçe topla;
+            # operand olmayan ilk token geri çekilir ve döngü biter
+            while try_take(_OPERAND_TOKENS):
+                append(lexer.yylex)  # Sona ekle
+        except StopIteration:
+            pass
+        stack.reverse()  # Tüketiciler operandları ters sırada bekler
         return stack
 
     # Komut ve operandları işleyen fonksiyon
     def instruction(self, instruction: yylex_t) -> Instruction_T:
         """
         Komut tokenı ve operandları çözümlenir.
-        Tuple olarak (<komut tipi>, operandlar deque) döner.
+        Tuple olarak (<komut tipi>, operandlar listesi) döner.
         """
         return (instruction['token'], self.operands())
+
+
+# Satırın ilk tokenı -> satır işleyicisi; mnemonic'ler tablo yerine
+# `type(current) is _MNEMONIC_CLASS` ile ayırt edilir
+_LINE_DISPATCH: Dict[Tokens.TokenEnum,
+                     Callable[[Parser], Optional[Instruction_T]]] = {
+    _LABEL: Parser._label_line,
+    _VARIABLE: Parser._variable_line,
+}
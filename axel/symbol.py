@@ -1,7 +1,7 @@
 
 
 # Tip tanımlamaları için gerekli modül
-from typing import Union, Dict, Tuple, TypeVar
+from typing import Union, Dict, NamedTuple, TypeVar
 
 # TypeVar'lar - kendi sınıflarımızı bound olarak kullanarak tür güvenliği sağlıyoruz
 X = TypeVar('X', bound='U_Int8')    # U_Int8 sınıfı için tür değişkeni
@@ -18,6 +18,9 @@ class U_Int8:
     Normal sayısal türler üzerinde kullanımı kolay operatörler sağlar ve
     sonucu işaretsiz türe dönüştürür.
     """
+
+    # Sembol tablosunda çok sayıda örnek tutulur; __dict__ yerine sabit alanlar
+    __slots__ = ('raw', 'num')
     
     def __init__(self, num: int) -> None:
         """U_Int8 nesnesini başlatır.
@@ -99,6 +102,8 @@ class Int8:
     Normal sayısal türler üzerinde kullanımı kolay operatörler sağlar ve
     sonucu 2'nin tümleyeni ile işaretli türe dönüştürür.
     """
+
+    __slots__ = ('num',)
     
     def __init__(self, num: int) -> None:
         """Int8 nesnesini başlatır.
@@ -120,14 +125,9 @@ class Int8:
         Returns:
             8-bit işaretli tamsayı değeri
         """
-        mask7 = 128     # 10000000 - 7. bit maskesi (işaret biti)
-        mask2s = 127    # 01111111 - 2'nin tümleyeni için maske
-        
-        # Eğer işaret biti set ise (negatif sayı)
-        if (mask7 & num == 128):
-            # 2'nin tümleyenini uygula: NOT işlemi + 1, sonra negatif yap
-            num = -((~int(num) + 1) & mask2s)
-        return num
+        # -128'i 0'a kaydırıp 8-bit maskele, sonra geri kaydır: dalsız
+        # 2'nin tümleyeni sarması (127 + 1 -> -128, -128 - 1 -> 127)
+        return ((num + 128) & 255) - 128
 
     def __repr__(self) -> str:
         """Nesnenin string temsilini döndürür."""
@@ -190,6 +190,8 @@ class U_Int16:
     Normal sayısal türler üzerinde kullanımı kolay operatörler sağlar ve
     sonucu işaretsiz türe dönüştürür.
     """
+
+    __slots__ = ('num',)
     
     def __init__(self, num: int) -> None:
         """U_Int16 nesnesini başlatır.
@@ -250,9 +252,19 @@ class U_Int16:
         return self
 
 
+class TableField(NamedTuple):
+    """Sembol tablosu alanı: (adres, tip, değer).
+
+    Tuple olduğu için `alan[2]` gibi indeksleme de çalışır; isimli
+    alanlar ise okumayı hem açık hem de tip güvenli kılar.
+    """
+    addr: U_Int16                         # Bellekteki adresi
+    type: str                             # 'label' veya 'variable'
+    value: Union[U_Int16, str, bytes]     # Sembol değeri
+
+
 # Sembol tablosu alan tipinin tanımı
-# Her alan: (adres, tip, değer) şeklinde tuple
-TableField_T = Tuple[U_Int16, str, Union[U_Int16, str, bytes]]
+TableField_T = TableField
 
 
 class Symbol_Table:
@@ -264,6 +276,8 @@ class Symbol_Table:
     Assembler'da kullanılan sembolik isimler (örn: LOOP1, DATA_START) 
     gerçek bellek adreslerine çevrilirken bu tablo kullanılır.
     """
+
+    __slots__ = ('table',)
     
     def __init__(self) -> None:
         """Sembol tablosunu başlatır."""
@@ -285,7 +299,7 @@ class Symbol_Table:
             type: Sembol tipi (örn: "LABEL", "VARIABLE", "CONSTANT")
             value: Sembol değeri (sayı, string veya byte verisi olabilir)
         """
-        self.table[label] = (addr, type, value)
+        self.table[label] = TableField(addr, type, value)
 
     def get(self, label: str) -> TableField_T:
         """Bir etiket veya değişken için tablo girişini getirir.
@@ -9,44 +9,51 @@ Token = Assembly kodundaki en küçük anlamlı birim (kelime, sayı, operatör
 Enum = Sabit değerler listesi (C'deki enum gibi)
 """
 
-from enum import Enum, unique, auto
-from typing import TypeVar
+from enum import IntEnum, unique, auto
+from itertools import count
+from typing import Any, Dict, Iterator, List
 
-# Tür güvenliği için TypeVar tanımı
-T = TypeVar('T', bound='TokenEnum')
+# Tüm token sınıfları tek bir sayaçtan değer alır; böylece farklı
+# sınıflardaki üyeler (örn: Token.T_EOL ve Mnemonic.T_ABA) hiçbir zaman
+# aynı tamsayıya sahip olmaz ve int eşitliği sınıflar arasında karışmaz
+_TOKEN_VALUES: Iterator[int] = count(1)
 
 
-class TokenEnum(Enum):
+class TokenEnum(IntEnum):
     """Token Numaralandırmaları için temel sınıf.
     
     Her enum'da faydalı detayları kapsüller ve hızlı erişim sağlar.
     Aynı zamanda her 'auto()' çağrısında benzersizlik garantisi verir.
     
-    Bu sınıf, standart Python Enum'unu genişleterek assembler'a
-    özel özellikler ekler.
+    Bu sınıf, standart Python IntEnum'unu genişleterek assembler'a
+    özel özellikler ekler. Üyeler küçük tamsayılardır: küme/sözlük
+    aramaları ve karşılaştırmalar C seviyesindeki int hash ve
+    eşitliğiyle yapılır.
     """
     
-    def _generate_next_value_(  # type: ignore
-            self: T,
+    @staticmethod
+    def _generate_next_value_(
+            name: str,
             start: int,
             count: int,
-            last_values: int) -> T:
+            last_values: List[Any]) -> int:
         """Otomatik değer üretici fonksiyonu.
         
         Python'un auto() fonksiyonu çağrıldığında bu fonksiyon çalışır.
-        Normalde auto() 1, 2, 3... şeklinde sayılar üretir.
-        Burada ise enum'un kendisini döndürüyoruz.
+        Normalde auto() her sınıfta 1, 2, 3... şeklinde sayılar üretir.
+        Burada ise tüm token sınıflarının paylaştığı sayaçtan bir
+        sonraki değer döndürülür.
         
         Args:
-            self: Enum nesnesi
+            name: Üyenin adı
             start: Başlangıç değeri
             count: Kaçıncı çağrı olduğu
             last_values: Önceki değerler
             
         Returns:
-            Enum nesnesinin kendisi
+            Token sınıfları genelinde benzersiz tamsayı
         """
-        return self
+        return next(_TOKEN_VALUES)
 
 
 @unique  # Bu decorator, enum değerlerinin benzersiz olmasını garantiler
@@ -81,7 +88,7 @@ class Token(TokenEnum):
 
 
 @unique
-class AddressingMode(TokenEnum):
+class AddressingMode(IntEnum):
     """Adresleme Modları.
     
     6800 mikroişlemci'nin desteklediği farklı adresleme şekilleri.
@@ -91,6 +98,10 @@ class AddressingMode(TokenEnum):
     - LDA #100    → Immediate addressing
     - LDA $50     → Direct addressing  
     - LDA $1000   → Extended addressing
+
+    Diğer token sınıflarından farklı olarak IntEnum'dur: opcode
+    çeviricileri her komutta modu karşılaştırıp opcode tablolarında
+    arar, int tabanlı eşitlik ve hash bu aramaları C seviyesinde tutar.
     """
     
     # Akümülatör adresleme - register A üzerinde işlem
@@ -254,9 +265,10 @@ Assembler'da dallanma komutları özel işlem gerektirir çünkü:
 2. Sadece -128 ile +127 byte aralığında atlayabilir
 3. Etiket çözümlemesi gerekir
 
-Kullanım: if mnemonic in Branch_Mnemonics: ...
+Kullanım: if mnemonic in Branch_Mnemonics: ... ya da is_branch(mnemonic)
+(Üyeler IntEnum olduğundan arama int hash'i ile yapılır.)
 """
-Branch_Mnemonics = set([
+Branch_Mnemonics = frozenset([
     Mnemonic.T_BCC,  # Branch if Carry Clear
     Mnemonic.T_BCS,  # Branch if Carry Set
     Mnemonic.T_BEQ,  # Branch if Equal
@@ -275,6 +287,28 @@ Branch_Mnemonics = set([
     Mnemonic.T_BVS   # Branch if Overflow Set
 ])
 
+# Dallanma komutları Mnemonic içinde art arda tanımlıdır (T_BCC ... T_BSR),
+# bu yüzden auto() ardışık değerler verir ve üyelik tek bir aralık
+# karşılaştırmasına iner. Mnemonic sırası değiştirilirken bu blok
+# birlikte tutulmalıdır; aralık bozulursa modül yüklenirken hata verilir.
+BRANCH_LO: int = min(Branch_Mnemonics)
+BRANCH_HI: int = max(Branch_Mnemonics)
+if BRANCH_HI - BRANCH_LO + 1 != len(Branch_Mnemonics):
+    raise ValueError('Branch mnemonics must be declared contiguously')
+
+
+def is_branch(mnemonic: TokenEnum) -> bool:
+    """Token bir dallanma komutu ise True döner (bkz. `BRANCH_LO`)."""
+    return BRANCH_LO <= mnemonic <= BRANCH_HI
+
+
+# Token -> isim tablosu: `.name` her erişimde enum descriptor'ından geçer,
+# çok sayıda token biçimlendiren yerler (örn: GUI listesi) bu tabloyu kullanır.
+# Token değerleri sınıflar arasında benzersiz olduğundan tek tablo yeterlidir.
+TOKEN_NAMES: Dict[TokenEnum, str] = {
+    token: token.name for kind in (Token, Register, Mnemonic) for token in kind
+}
+
 
 # === KULLANIM ÖRNEKLERİ ===
 """
@@ -1,28 +1,37 @@
 import tkinter as tk
 from tkinter import ttk
+from operator import itemgetter
+from axel.tokens import TOKEN_NAMES
+
+_get_data = itemgetter('data')
+_TITLE_FONT = ('Arial', 14, 'bold')
 
 def launch_gui(parsed_instructions, symbol_table):
     root = tk.Tk()
     root.title("Motorola 6800 Assembly Görselleştirici")
+    # Pencere kurulum bitene kadar gizli; geometri tek seferde hesaplanır
+    root.withdraw()
 
-    ttk.Label(root, text="Instruction List", font=('Arial', 14, 'bold')).pack(pady=10)
+    ttk.Label(root, text="Instruction List", font=_TITLE_FONT).pack(pady=10)
 
     listbox = tk.Listbox(root, width=100, height=20)
     listbox.pack()
 
-    for mnemonic, operands in parsed_instructions:
-        operand_strs = []
-        for op in operands:
-            operand_strs.append(op['data'])
-        line = f"{mnemonic.name} " + ', '.join(operand_strs)
-        listbox.insert(tk.END, line)
+    lines = [
+        f"{TOKEN_NAMES[mnemonic]} " + ', '.join(map(_get_data, operands))
+        for mnemonic, operands in parsed_instructions]
+    # Tek Tcl çağrısıyla tüm satırları ekle
+    listbox.insert(tk.END, *lines)
 
-    ttk.Label(root, text="Symbols", font=('Arial', 14, 'bold')).pack(pady=10)
+    ttk.Label(root, text="Symbols", font=_TITLE_FONT).pack(pady=10)
 
     symbol_listbox = tk.Listbox(root, width=100, height=10)
     symbol_listbox.pack()
 
-    for label, (addr, typ, val) in symbol_table.items():
-        symbol_listbox.insert(tk.END, f"{label} @ {addr} ({typ}) -> {val}")
+    symbol_listbox.insert(tk.END, *[
+        f"{label} @ {addr} ({typ}) -> {val}"
+        for label, (addr, typ, val) in symbol_table.items()])
 
+    root.update_idletasks()
+    root.deiconify()
     root.mainloop()
@@ -0,0 +1,14 @@
+# Testler arasında paylaşılan fixture'lar
+import pytest
+import pathlib
+
+
+@pytest.fixture(scope='session')  # type: ignore
+def fixture_asm_source() -> str:
+    """
+    test/etc/fixture.asm içeriğini döner.
+    Dosya oturum başına bir kez okunur; onu kullanan tüm testler aynı
+    metni paylaşır (str değiştirilemez, paylaşmak güvenlidir).
+    """
+    path = pathlib.Path(__file__).parent / 'etc' / 'fixture.asm'
+    return path.read_text()
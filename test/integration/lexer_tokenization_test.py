@@ -1,12 +1,10 @@
 
 # Gerekli test ve utility kütüphanelerini içe aktarım
 import pytest  # Test framework'ü
-import pathlib  # Dosya yolu işlemleri için
-from typing import Callable  # Tip belirtimi için
-from collections import deque  # Çift yönlü kuyruk veri yapısı
+from typing import Callable, FrozenSet, Tuple  # Tip belirtimi için
 
 # Lexer ile ilgili sınıfları içe aktarım
-from axel.tokens import Token, Mnemonic, Register  # Token türleri ve assembly komutları
+from axel.tokens import TokenEnum, Token, Mnemonic, Register  # Token türleri ve assembly komutları
 from axel.lexer import Lexer  # Ana lexer sınıfı
 
 
@@ -29,9 +27,9 @@ def lexer() -> Callable[[str], Lexer]:
     return _make_lexer
 
 
-# Beklenen token sırasını içeren deque (çift yönlü kuyruk)
+# Beklenen token sırasını içeren değiştirilemez tuple
 # Bu, test dosyasından çıkarılması gereken token'ların doğru sırasını temsil eder
-expected = deque([
+expected: Tuple[TokenEnum, ...] = (
     # Değişken tanımı: REDIS = $FFFF
     Token.T_VARIABLE,        # Değişken adı
     Token.T_EQUAL,           # Eşittir işareti
@@ -74,12 +72,12 @@ expected = deque([
     Mnemonic.T_LDA,          # Load Accumulator
     Register.T_B,            # B register'ı
     Token.T_DIR_ADDR_UINT8   # 8-bit doğrudan adres
-])
+)
 
 
 # Beklenen sembol tablosundaki sembollerin listesi
 # Bu semboller assembly kodunda tanımlanan değişken ve label'ları temsil eder
-symbols = deque([
+symbols: FrozenSet[str] = frozenset([
     'REDIS',   # $FFFF değerindeki değişken
     'DIGADD',  # $00 değerindeki değişken
     'OUTCH',   # $FFFF değerindeki değişken
@@ -88,7 +86,7 @@ symbols = deque([
 ])
 
 
-def test_lexer_tokenization() -> None:
+def test_lexer_tokenization(fixture_asm_source: str) -> None:
     """
     Lexer'ın tokenization (sözcük analizi) işlevini test eden ana test fonksiyonu
     
@@ -99,28 +97,15 @@ def test_lexer_tokenization() -> None:
     4. Sembol tablosunun doğru oluşturulduğunu kontrol eder
     """
     
-    # Test dosyasının yolunu dinamik olarak oluştur
-    # __file__ bu Python dosyasının yolu
-    # parent.parent ile iki seviye yukarı çık
-    # /etc/fixture.asm dosyasını aç
-    with open(f'{pathlib.Path(__file__).parent.parent}/etc/fixture.asm') as f:
-        # Dosya içeriğini okuyarak Lexer objesi oluştur
-        test = Lexer(f.read())
-        
-        # Lexer iterator olarak çalışır, her iterasyonda bir token döner
-        for token in test:
-            # Üretilen token'ı beklenen token ile karşılaştır
-            # popleft() ile deque'nin solundan eleman çıkar
-            assert token is expected.popleft()
-        
-        # Tüm beklenen token'ların işlendiğini kontrol et
-        assert len(expected) == 0
-        
-        # Sembol tablosu testi
-        # Lexer'ın sembol tablosunda beklenen sayıda sembol olduğunu kontrol et
-        assert len(test.symbols.table) == len(symbols)
-        
-        # Her beklenen sembolün sembol tablosunda bulunduğunu kontrol et
-        while len(symbols):
-            # pop() ile deque'nin sağından eleman çıkar ve sembol tablosunda ara
-            assert symbols.pop() in test.symbols.table
\ No newline at end of file
+    # Dosya içeriği oturum fixture'ından gelir (bir kez okunur);
+    # içerikten Lexer objesi oluştur
+    test = Lexer(fixture_asm_source)
+
+    # Lexer iterator olarak çalışır, her iterasyonda bir token döner;
+    # tüm akış tek seferde toplanıp beklenen sırayla karşılaştırılır
+    # (uyuşmazlıkta pytest farkın tamamını gösterir)
+    assert tuple(test) == expected
+
+    # Sembol tablosu testi
+    # Lexer'ın sembol tablosunun tam olarak beklenen sembolleri içerdiğini kontrol et
+    assert test.symbols.table.keys() == symbols
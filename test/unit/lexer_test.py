@@ -9,11 +9,13 @@ f1_t = Callable[[str], Lexer]
 f2_t = List[str]
 
 
-@pytest.fixture  # type: ignore
+@pytest.fixture(scope='module')  # type: ignore
 def lexer() -> Callable[[str], Lexer]:
+    pool = Lexer('')
 
     def _make_lexer(source: str) -> Lexer:
-        return Lexer(source)
+        pool.reset(source)
+        return pool
 
     return _make_lexer
 
@@ -43,6 +45,12 @@ def test_skip_whitespace_comments(lexer: f1_t, whitespace: f2_t) -> None:
     assert test.pointer == 'A'
 
 
+def test_bytes_source() -> None:
+    test = Lexer(b'ADD B #$10')
+    assert list(test) == [Mnemonic.T_ADD, Register.T_B, Token.T_IMM_UINT8]
+    assert test.yylex['data'] == '#$10'
+
+
 def test_read_term(lexer: f1_t) -> None:
     test = lexer(' ADD  B   #$10  ')
     term1 = test._read_term()
@@ -69,20 +77,6 @@ def test_retract(lexer: f1_t) -> None:
     assert test._pointer == test._at
 
 
-def test_inc(lexer: f1_t) -> None:
-    test = lexer('ADD B #$10')
-    test._pointer = 3
-    test._inc()
-    assert test._pointer == 4
-
-
-def test_dec(lexer: f1_t) -> None:
-    test = lexer('ADD B #$10')
-    test._pointer = 3
-    test._dec()
-    assert test._pointer == 2
-
-
 def test_reset(lexer: f1_t) -> None:
     test = lexer('ADD B #$10')
     default = {
@@ -110,13 +104,6 @@ def test_set_token(lexer: f1_t) -> None:
     assert test._last == Token.T_LABEL
 
 
-def test_skip_to_next_line(lexer: f1_t, whitespace: f2_t) -> None:
-    test = lexer(whitespace[3])
-    test._skip_to_next_line()
-    test._pointer += len(linesep)  # halt at newline
-    assert test.pointer == 'A'
-
-
 def test_peek_next(lexer: f1_t) -> None:
     test = lexer('ABA  #$10')
     test._pointer = 3
@@ -132,12 +119,12 @@ def test_variable_token(lexer: f1_t) -> None:
     assert test._variable_token('OUT') is None
 
 
-def test_comma_token(lexer: f1_t) -> None:
-    test = lexer('LDAA $10,X')
-    test._pointer = 8
-    assert test._comma_token(',') is Token.T_COMMA
-    test._pointer = 0
-    assert test._comma_token(',') is None
+def test_eol_token(lexer: f1_t) -> None:
+    test = lexer('NOP ; comment\r\nTAB\r\n')
+    assert list(test) == [Mnemonic.T_NOP, Token.T_EOL,
+                          Mnemonic.T_TAB, Token.T_EOL]
+    assert test._eol_token('\n') is Token.T_EOL
+    assert test._eol_token('TAB') is None
 
 
 def test_label_token(lexer: f1_t) -> None:
@@ -186,6 +173,20 @@ def test_displacement_token(lexer: f1_t) -> None:
     assert test._displacement_token('LDA') is None
 
 
+def test_address_before_bare_x(lexer: f1_t) -> None:
+    # An address or immediate followed by a bare X stays an operand token
+    assert list(lexer('SUB $10 X')) == [
+        Mnemonic.T_SUB, Token.T_DIR_ADDR_UINT8, Register.T_X]
+    assert list(lexer('LDA #$1234 X')) == [
+        Mnemonic.T_LDA, Token.T_IMM_UINT16, Register.T_X]
+    assert list(lexer('SUB $1 X')) == [
+        Mnemonic.T_SUB, Token.T_UNKNOWN, Register.T_X]
+    assert list(lexer('LDA #$123 X')) == [
+        Mnemonic.T_LDA, Token.T_UNKNOWN, Register.T_X]
+    assert list(lexer('LDA $10,X')) == [
+        Mnemonic.T_LDA, Token.T_DIR_ADDR_UINT8, Token.T_COMMA, Register.T_X]
+
+
 def test_mnemonic_token(lexer: f1_t) -> None:
     test = lexer('ASL A')
     test._pointer = 0
@@ -206,3 +207,24 @@ def test_register_token(lexer: f1_t) -> None:
     test = lexer('ADD B #$10')
     test._pointer = 4
     assert test._register_token('B') is Register.T_B
+
+
+def test_symbol_names_interned() -> None:
+    test = Lexer('OUT = $F0\nSTART BNE OUT\n')
+    target = None
+    for token in test:
+        if token is Token.T_DISP_ADDR_INT8:
+            target = test.yylex['data']
+    assert target == 'OUT'
+    # Branch hedefi ile tablo anahtarı aynı (intern edilmiş) nesnedir
+    assert [name for name in test.symbols.table if name is target] == ['OUT']
+
+
+def test_reset_source(lexer: f1_t) -> None:
+    test = lexer('OUT = $F0\n')
+    list(test)
+    assert 'OUT' in test.symbols.table
+    test.reset('ADD B #$10')
+    assert 'OUT' not in test.symbols.table
+    assert test.yylex['token'] is Token.T_UNKNOWN
+    assert list(test) == [Mnemonic.T_ADD, Register.T_B, Token.T_IMM_UINT8]
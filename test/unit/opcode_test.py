@@ -1,62 +1,209 @@
 
 import pytest
+from functools import lru_cache
 from typing import Callable, Any
-from typing import Iterator
-from axel.symbol import U_Int8
+from typing import Iterator, List
 from axel.assembler import Registers
-from axel.tokens import AddressingMode
-from axel.parser import Parser
+from axel.tokens import AddressingMode, Mnemonic, Token
+from axel.lexer import Lexer, yylex_t
+from axel.parser import Parser, Instruction_T, AssemblerParserError
 from axel.opcode import Translate
 
 f1_t = Callable[[], Any]
 f2_t = Callable[[str], Parser]
+f3_t = Callable[[str], Instruction_T]
 
 
 @pytest.fixture(scope='module')  # type: ignore
 def registers() -> Iterator[Any]:
-    Registers.AccA = U_Int8(0)
-    Registers.AccB = U_Int8(0)
     yield Registers
 
 
-@pytest.fixture  # type: ignore
+@pytest.fixture(scope='module')  # type: ignore
 def parser() -> Callable[[str], Parser]:
+    pool = Lexer('')
+
     def _get_parser(source: str) -> Parser:
-        parser = Parser(source)
-        return parser
+        pool.reset(source)
+        return Parser(source, lexer=pool)
 
     return _get_parser
 
 
-def test_opcode_aba(parser: f2_t, registers: f1_t) -> None:
-    test = parser('ABA\n')
-    line = test.line()
-    if isinstance(line, bool):
-        raise AssertionError('line is bool')
-    instruction, operands = line
+@pytest.fixture(scope='module')  # type: ignore
+def parse_line(parser: f2_t) -> f3_t:
+    # Aynı kaynak satırı modül içinde bir kez çözümlenir; çeviriciler
+    # operand listelerini değiştirmediği için sonuç güvenle paylaşılır
+    @lru_cache(maxsize=256)
+    def _parse_line(source: str) -> Instruction_T:
+        line = parser(source).line()
+        if line is None:
+            raise AssertionError('line is None')
+        return line
+
+    return _parse_line
+
+
+def test_opcode_aba(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('ABA\n')
     r = registers()
-    r.AccA = U_Int8(5)
-    r.AccB = U_Int8(10)
+    r.AccA = 5
+    r.AccB = 10
     assert Translate.aba(AddressingMode.ACC, operands, r) == b'\x1b'
-    assert r.AccA.num == 15
+    assert r.AccA == 15
 
 
-def test_opcode_adc(parser: f2_t, registers: f1_t) -> None:
-    test = parser('ADC A #$10\n')
-    line = test.line()
-    if isinstance(line, bool):
-        raise AssertionError('line is bool')
-    instruction, operands = line
+def test_opcode_adc(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('ADC A #$10\n')
     r = registers()
-    r.AccA = U_Int8(255)
+    r.AccA = 255
     assert Translate.adc(AddressingMode.IMM, operands, r) == b'\x89\x10'
     # test carry
-    assert Translate.adc(AddressingMode.IMM, operands, r) == b'\x890'
-    test = parser('ADC B #$10\n')
-    line = test.line()
-    if isinstance(line, bool):
-        raise AssertionError('line is bool')
-    instruction, operands = line
-    r = registers()
-    r.AccB = U_Int8(0)
+    assert Translate.adc(AddressingMode.IMM, operands, r) == b'\x89\x11'
+    instruction, operands = parse_line('ADC B #$10\n')
+    r = registers()
+    r.AccB = 0
     assert Translate.adc(AddressingMode.IMM, operands, r) == b'\xC9\x10'
+    # single hex digit operands are emitted as one full byte
+    instruction, operands = parse_line('ADC A #$05\n')
+    r = registers()
+    assert Translate.adc(AddressingMode.IMM, operands, r) == b'\x89\x05'
+
+
+def test_opcode_lda(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('LDA #$10\n')
+    r = registers()
+    assert Translate.lda(AddressingMode.IMM, operands, r) == b'\x86'
+    assert r.AccA == 16
+
+
+def test_opcode_branch(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('BNE $10\n')
+    r = registers()
+    assert Translate.bne(AddressingMode.REL, operands, r) == b'\x26\x10'
+    assert Translate.bra(AddressingMode.REL, operands, r) == b'\x20\x10'
+
+
+def test_opcode_inherent(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('NOP\n')
+    r = registers()
+    assert Translate.nop(AddressingMode.INH, operands, r) == b'\x01'
+    assert Translate.rts(AddressingMode.INH, operands, r) == b'\x39'
+
+
+def test_opcode_dispatch(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('BNE $10\n')
+    r = registers()
+    assert Translate.DISPATCH['bne'](AddressingMode.REL, operands, r) == b'\x26\x10'
+    assert Translate.DISPATCH['and'] is not None
+    assert 'and_' not in Translate.DISPATCH
+
+
+def test_opcode_immediate_specialized(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('ADD B #$10\n')
+    r = registers()
+    r.AccB = 5
+    assert Translate.addb_imm(AddressingMode.IMM, operands, r) == \
+        Translate.add(AddressingMode.IMM, operands, r)
+    assert r.AccB == 0x25
+    instruction, operands = parse_line('ADC A #$10\n')
+    r = registers()
+    r.AccA = 255
+    assert Translate.adca_imm(AddressingMode.IMM, operands, r) == b'\x89\x10'
+    # test carry
+    assert Translate.adca_imm(AddressingMode.IMM, operands, r) == b'\x89\x11'
+    assert 'adca_imm' in Translate.DISPATCH
+
+
+def test_opcode_index_wraps(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('DEX\n')
+    r = registers()
+    assert Translate.dex(AddressingMode.INH, operands, r) == b'\x09'
+    assert r.X == 0xFFFF
+    assert Translate.inx(AddressingMode.INH, operands, r) == b'\x08'
+    assert r.X == 0
+
+
+def test_opcode_emit(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('STA A $10\n')
+    r = registers()
+    assert Translate.emit('sta', AddressingMode.DIR, operands, r) == b'\x97'
+    assert Translate.emit('sta', AddressingMode.IDX, operands, r) == b'\xa7'
+    assert Translate.emit('stx', AddressingMode.IDX, operands, r) == b''
+
+
+def test_opcode_shift(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('ROL B\n')
+    r = registers()
+    r.AccB = 0x81
+    assert Translate.rol(AddressingMode.ACC, operands, r) == b'\x59'
+    assert r.AccB == 0x02
+    assert Translate.asl(AddressingMode.ACC, operands, r) == b'\x58'
+    assert r.AccB == 0x04
+    assert Translate.lsr(AddressingMode.IMM, operands, r) == b''
+
+
+def test_opcode_sub(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('SUB B #$10\n')
+    r = registers()
+    r.AccB = 0x30
+    assert Translate.sub(AddressingMode.IMM, operands, r) == b'\xc0'
+    assert r.AccB == 0x20
+    assert Translate.sub(AddressingMode.DIR, operands, r) == b'\xd0'
+    assert Translate.sbc(AddressingMode.IMM, operands, r) == b'\xc2'
+    assert r.AccB == 0x10
+
+
+def test_opcode_emit_mnemonic(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('STA A $10\n')
+    r = registers()
+    assert Translate.emit_mnemonic(
+        Mnemonic.T_STA, AddressingMode.DIR, operands, r) == b'\x97'
+    assert Translate.MNEMONICS[Mnemonic.T_AND] is Translate.DISPATCH['and']
+
+
+def test_opcode_ora(parse_line: f3_t, registers: f1_t) -> None:
+    instruction, operands = parse_line('ORA A #$10\n')
+    r = registers()
+    assert Translate.ora(AddressingMode.IMM, operands, r) == b'\x8a'
+    assert Translate.emit('ora', AddressingMode.IMM, operands, r) == b'\x8a'
+    assert Translate.MNEMONICS[Mnemonic.T_ORA] is Translate.DISPATCH['ora']
+
+
+def test_opcode_no_operands(registers: f1_t) -> None:
+    r = registers()
+    for name in ('add', 'and', 'cmp', 'eor', 'ora', 'sbc', 'sub'):
+        assert Translate.emit(name, AddressingMode.INH, [], r) == b''
+
+
+def test_opcode_immediate_without_data(registers: f1_t) -> None:
+    r = registers()
+    operands: List[yylex_t] = [{'token': Token.T_IMM_UINT8, 'data': None}]
+    for name in ('add', 'and', 'lda', 'ldb', 'sbc', 'sub'):
+        with pytest.raises(AssemblerParserError):
+            Translate.emit(name, AddressingMode.IMM, operands, r)
+
+
+@pytest.mark.parametrize('specialized,generic,source', [  # type: ignore
+    ('adca_imm', 'adc', 'ADC A #$10\n'),
+    ('adcb_imm', 'adc', 'ADC B #$10\n'),
+    ('adda_imm', 'add', 'ADD A #$10\n'),
+    ('addb_imm', 'add', 'ADD B #$10\n'),
+    ('anda_imm', 'and', 'AND A #$10\n'),
+    ('andb_imm', 'and', 'AND B #$10\n'),
+    ('eora_imm', 'eor', 'EOR A #$10\n'),
+    ('eorb_imm', 'eor', 'EOR B #$10\n'),
+    ('oraa_imm', 'ora', 'ORA A #$10\n'),
+    ('orab_imm', 'ora', 'ORA B #$10\n'),
+])
+def test_opcode_immediate_matches_generic(parse_line: f3_t,
+                                          registers: f1_t,
+                                          specialized: str,
+                                          generic: str,
+                                          source: str) -> None:
+    instruction, operands = parse_line(source)
+    r1, r2 = registers(), registers()
+    r1.AccA = r2.AccA = r1.AccB = r2.AccB = 0x31
+    assert Translate.DISPATCH[specialized](AddressingMode.IMM, operands, r1) == \
+        Translate.DISPATCH[generic](AddressingMode.IMM, operands, r2)
+    assert (r1.AccA, r1.AccB) == (r2.AccA, r2.AccB)
@@ -1,6 +1,6 @@
 
 import pytest
-from typing import List, Callable, Optional, Deque
+from typing import List, Callable, Optional
 import axel.tokens as Tokens  # Token, Mnemonic, Register
 from axel.lexer import Lexer, yylex_t
 from axel.symbol import Symbol_Table
@@ -55,9 +55,18 @@ def test_take(parser: f1_t, code: f3_t) -> None:
     test.take([Tokens.Token.T_IMM_UINT8])
 
 
+def test_try_take(parser: f1_t, code: f3_t) -> None:
+    test = parser(code[0], None)
+    test.take(Tokens.Token.T_LABEL)
+    assert not test.try_take(frozenset([Tokens.Mnemonic.T_ABA]))
+    assert test.try_take(frozenset([Tokens.Mnemonic.T_LDA]))
+
+
 def test_parse_immediate_value(parser: f1_t, code: f3_t) -> None:
     assert Parser.parse_immediate_value('#$10') == b'\x10'
     assert Parser.parse_immediate_value('$10') == b'\x10'
+    assert Parser.parse_immediate_value_int('#$10') == 16
+    assert Parser.parse_immediate_value_int('$FE3A') == 0xFE3A
 
 
 def test_error(parser: f1_t, code: f3_t) -> None:
@@ -72,9 +81,9 @@ def test_error(parser: f1_t, code: f3_t) -> None:
 def test_line(parser: f1_t, code: f3_t) -> None:
     test = parser(code[3], None)
     instruction: Tokens.TokenEnum
-    operands: Deque[yylex_t]
+    operands: List[yylex_t]
     line = test.line()
-    if not isinstance(line, bool):
+    if line is not None:
         instruction, operands = line
     assert instruction == Tokens.Mnemonic.T_ADD
     assert operands.pop()['token'] == Tokens.Register.T_B
@@ -82,6 +91,17 @@ def test_line(parser: f1_t, code: f3_t) -> None:
     assert len(operands) == 0
 
 
+def test_parse() -> None:
+    test = Parser('OUTCH = $FE3A\nABA\n\nADD B #$10\n')
+    lines = list(test.parse())
+    assert [line[0] for line in lines] == [
+        Tokens.Mnemonic.T_ABA, Tokens.Mnemonic.T_ADD]
+    assert len(lines[1][1]) == 2
+    assert iter(test) is test
+    with pytest.raises(StopIteration):
+        next(test)
+
+
 def test_variable(parser: f1_t, code: f3_t, symbol_table: f2_t) -> None:
     test = parser(code[1], symbol_table(code[1]))
     next(test.lexer)  # eat token
@@ -93,6 +113,25 @@ def test_variable(parser: f1_t, code: f3_t, symbol_table: f2_t) -> None:
     assert test.lexer._pointer == 13
 
 
+def test_variable_shared_lexer() -> None:
+    source = 'OUTCH = $FE3A\nSTART JSR $FCBC\n'
+    scanner = Lexer(source)
+    test = Parser(source, lexer=scanner)
+    assert test.lexer is scanner
+    assert test.symbols is scanner.symbols
+    line = test.line()
+    assert line is not None and line[0] == Tokens.Mnemonic.T_JSR
+    assert test.symbols.table['OUTCH'][2] == b'\xfe:'
+
+
+def test_default_symbols_not_shared() -> None:
+    first = Parser('OUTCH = $FE3A\n')
+    second = Parser('START ABA\n')
+    assert first.symbols is not second.symbols
+    assert 'START' not in first.symbols.table
+    assert 'OUTCH' not in second.symbols.table
+
+
 def test_operands(parser: f1_t, code: f3_t) -> None:
     test = parser(code[0], None)
     test.lexer._pointer = 9
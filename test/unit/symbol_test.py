@@ -1,6 +1,6 @@
 
 import pytest  # noqa: F401
-from axel.symbol import U_Int8, Int8, U_Int16, Symbol_Table
+from axel.symbol import U_Int8, Int8, U_Int16, Symbol_Table, TableField
 
 
 def test_uint8() -> None:
@@ -23,14 +23,15 @@ def test_uint8() -> None:
 def test_int8() -> None:
     int8 = Int8(-128)
     int8_2 = Int8(127)
-    assert int8 + 5 == 5
-    assert int8 - 5 == -5
-    assert int8_2 + 1 == 0
+    assert int8 + 5 == -123
+    assert int8 - 5 == 123
+    assert int8_2 + 1 == -128
     assert int8_2 - 5 == 127 - 5
+    assert Int8(255).num == -1
     int8 += 1
-    assert int8.num == 1
+    assert int8.num == -127
     int8 -= 2
-    assert int8.num == -1
+    assert int8.num == 127
 
 
 def test_uint16() -> None:
@@ -51,11 +52,12 @@ def test_symbol_table_set() -> None:
     assert test.table['test'][0].num == 255
     assert test.table['test'][1] == 'variable'
     assert test.table['test'][2] == 'testing'
+    assert test.table['test'].value == 'testing'
 
 
 def test_symbol_table_get() -> None:
     test = Symbol_Table()
-    test.table['test'] = (U_Int16(255), 'variable', 'testing')
+    test.table['test'] = TableField(U_Int16(255), 'variable', 'testing')
     assert test.get('test')[0].num == 255
     assert test.get('test')[1] == 'variable'
     assert test.get('test')[2] == 'testing'
@@ -0,0 +1,13 @@
+
+from axel.tokens import Token, Register, Mnemonic, Branch_Mnemonics
+from axel.tokens import BRANCH_LO, BRANCH_HI, is_branch
+
+
+def test_branch_range() -> None:
+    # Dallanma komutları ardışık değerlere sahip olmalı (aralık kontrolü)
+    assert sorted(Branch_Mnemonics) == list(range(BRANCH_LO, BRANCH_HI + 1))
+    assert BRANCH_LO == Mnemonic.T_BCC
+    assert BRANCH_HI == Mnemonic.T_BSR
+    for kind in (Token, Register, Mnemonic):
+        for token in kind:
+            assert is_branch(token) == (token in Branch_Mnemonics)